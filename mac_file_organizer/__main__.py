@@ -38,7 +38,10 @@ def main():
         elif args.once:
             logger.info("Running organization once")
             file_manager = FileManager()
-            file_manager.run_scan_cycle()
+            try:
+                file_manager.run_scan_cycle()
+            finally:
+                file_manager.close()
             logger.info("Organization completed")
         else:
             # By default, run in daemon mode
@@ -1,14 +1,26 @@
 """
 Configuration settings for the Mac File Organizer.
 """
+import os
 import json
+import logging
+import functools
 from pathlib import Path
 
+logger = logging.getLogger('mac-file-organizer')
+
 # User directories
 HOME_DIR = Path.home()
 DOWNLOADS_DIR = HOME_DIR / "Downloads"
 DESKTOP_DIR = HOME_DIR / "Desktop"
 
+# String forms of the user directories for os-level calls in hot paths
+DOWNLOADS_STR = str(DOWNLOADS_DIR)
+DESKTOP_STR = str(DESKTOP_DIR)
+
+# Log file of the daemon
+LOG_PATH = HOME_DIR / "Library" / "Logs" / "mac-file-organizer.log"
+
 # Special folders
 MANUAL_FOLDER_NAME = "Manual"
 REVIEW_FOLDER_NAME = "Review"
@@ -23,8 +35,9 @@ REVIEW_TAG_COLOR = "blue"
 REVIEW_THRESHOLD = 60 * 60 * 24 * 14  # 14 days
 
 # Load file categories
+@functools.lru_cache(maxsize=1)
 def get_file_categories():
-    """Load file categories from JSON file."""
+    """Load file categories from JSON file (parsed once per process)."""
     try:
         resource_path = Path(__file__).parent.parent / "resources" / "file_categories.json"
         with open(resource_path, "r") as f:
@@ -42,8 +55,60 @@ def get_file_categories():
             "Others": []
         }
 
-# Scan interval (in seconds)
-SCAN_INTERVAL = 3600  # Check every hour
+# Minimum number of files before grouping is spread over worker processes;
+# handing a batch to running workers costs about a millisecond, which
+# grouping fewer files here doesn't take
+PARALLEL_MIN_FILES = 500
+
+# Number of threads moving files into their folders; smaller batches are
+# moved one by one
+MOVE_THREADS = 8
+
+# Interval between full scans (in seconds); the only way changes are found
+# when file system events are unavailable, and a safety net for events the
+# watcher coalesced or dropped otherwise; can be overridden with the MAC_FILE_ORGANIZER_SCAN_INTERVAL environment variable
+DEFAULT_SCAN_INTERVAL = 3600  # Check every hour
+
+
+def _read_scan_interval():
+    """
+    Read the scan interval from the environment.
+
+    Returns:
+        int: The interval in seconds, or DEFAULT_SCAN_INTERVAL when the
+        variable is unset, not an integer or not positive
+    """
+    value = os.environ.get("MAC_FILE_ORGANIZER_SCAN_INTERVAL")
+    if value is None:
+        return DEFAULT_SCAN_INTERVAL
+
+    try:
+        interval = int(value)
+    except ValueError:
+        logger.warning(f"Invalid MAC_FILE_ORGANIZER_SCAN_INTERVAL {value!r}, using {DEFAULT_SCAN_INTERVAL}")
+        return DEFAULT_SCAN_INTERVAL
+
+    if interval <= 0:
+        logger.warning(f"MAC_FILE_ORGANIZER_SCAN_INTERVAL must be positive, got {interval}, using {DEFAULT_SCAN_INTERVAL}")
+        return DEFAULT_SCAN_INTERVAL
+
+    return interval
+
+
+SCAN_INTERVAL = _read_scan_interval()
+
+# Interval between Review sweeps and empty folder cleanup in daemon mode (in seconds)
+HOUSEKEEPING_INTERVAL = 600  # Every 10 minutes
+
+# Quiet period before acting on file system events (in seconds)
+WATCH_DEBOUNCE = 1.6
+
+# Suffixes of downloads still in progress (Chrome, Safari, Firefox and others);
+# such items are left alone until they are renamed to their final name
+PARTIAL_DOWNLOAD_SUFFIXES = ('.crdownload', '.download', '.part', '.partial')
+
+# Cache of already grouped directories, kept across runs
+SCAN_CACHE_PATH = HOME_DIR / "Library" / "Caches" / "mac-file-organizer.db"
 
 # Debugging flag (set to True for more verbose output)
 DEBUG = False
@@ -1,13 +1,22 @@
 """
 Daemon implementation for running as a background service.
 """
-import time
+import os
 import logging
 import signal
-import sys
-from pathlib import Path
+import threading
 
-from mac_file_organizer.config import SCAN_INTERVAL
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # Fall back to periodic scans
+    FileSystemEventHandler = object
+    Observer = None
+
+from mac_file_organizer.config import (
+    DOWNLOADS_STR, DESKTOP_STR, LOG_PATH,
+    HOUSEKEEPING_INTERVAL, SCAN_INTERVAL, WATCH_DEBOUNCE
+)
 from mac_file_organizer.file_manager import FileManager
 
 # Set up logging
@@ -15,21 +24,177 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(Path.home() / 'Library' / 'Logs' / 'mac-file-organizer.log'),
+        logging.FileHandler(LOG_PATH),
         logging.StreamHandler()
     ]
 )
 logger = logging.getLogger('mac-file-organizer')
 
-# Global flag for graceful shutdown
-running = True
+# Set by the signal handler for graceful shutdown
+stop_event = threading.Event()
+
+# Serializes file manager work between the watcher and housekeeping threads
+cycle_lock = threading.Lock()
+
+
+def _stat_signature(path):
+    """
+    Get what tells whether an item is still being written.
+
+    Args:
+        path (str): Item to inspect
+
+    Returns:
+        tuple: (st_size, st_mtime_ns), or None if the item is gone
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class ChangeCollector(FileSystemEventHandler):
+    """Collects paths reported by the file system watcher."""
+
+    def __init__(self):
+        """Initialize the change collector."""
+        self._lock = threading.Lock()
+        self._paths = {}
+        self.changed = threading.Event()
+
+    def on_any_event(self, event):
+        """Record the paths touched by a file system event."""
+        paths = [event.src_path]
+        if getattr(event, 'dest_path', None):
+            paths.append(event.dest_path)
+        for path in paths:
+            self.add(path, _stat_signature(path))
+
+    def add(self, path, signature):
+        """
+        Record a changed path.
+
+        Args:
+            path (str): Path that changed
+            signature (tuple): Its _stat_signature() at the time of the change
+        """
+        with self._lock:
+            self._paths[path] = signature
+        self.changed.set()
+
+    def drain(self):
+        """Return and reset the paths collected so far, with their signatures."""
+        with self._lock:
+            paths, self._paths = self._paths, {}
+            self.changed.clear()
+        return paths
 
 
 def signal_handler(sig, frame):
     """Handle shutdown signals."""
-    global running
     logger.info(f"Received signal {sig}, shutting down...")
-    running = False
+    stop_event.set()
+
+
+def _file_watch_loop(file_manager, collector):
+    """Organize changed items as the watcher reports them."""
+    while True:
+        collector.changed.wait()
+        if stop_event.is_set():
+            break
+
+        # Let bursts of events (e.g. a download in progress) settle first
+        while True:
+            collector.changed.clear()
+            if stop_event.wait(WATCH_DEBOUNCE):
+                return
+            if not collector.changed.is_set():
+                break
+
+        # Items that changed without further events (e.g. a download whose
+        # events were coalesced) are still being written; look at them again
+        # after another quiet period
+        settled_paths = []
+        for path, signature in collector.drain().items():
+            current = _stat_signature(path)
+            if current == signature:
+                settled_paths.append(path)
+            else:
+                collector.add(path, current)
+
+        if not settled_paths:
+            continue
+
+        with cycle_lock:
+            try:
+                file_manager.process_changes(settled_paths)
+            except Exception as e:
+                logger.error(f"Error processing changes: {e}", exc_info=True)
+
+
+def _housekeeping_loop(file_manager):
+    """Periodically move old files to Review and clean up empty folders."""
+    while not stop_event.wait(HOUSEKEEPING_INTERVAL):
+        with cycle_lock:
+            try:
+                file_manager.run_housekeeping()
+            except Exception as e:
+                logger.error(f"Error in housekeeping: {e}", exc_info=True)
+
+
+def _polling_loop(file_manager):
+    """Rescan both directories every SCAN_INTERVAL seconds until shutdown."""
+    while not stop_event.wait(SCAN_INTERVAL):
+        with cycle_lock:
+            try:
+                logger.info("Running scan cycle...")
+                file_manager.run_scan_cycle()
+                logger.info("Scan cycle completed.")
+            except Exception as e:
+                logger.error(f"Error in scan cycle: {e}", exc_info=True)
+
+
+def _watch(file_manager):
+    """
+    Organize changes as they happen until shutdown.
+
+    Returns:
+        bool: False if file system events are unavailable
+    """
+    if Observer is None:
+        logger.warning("watchdog is not installed, file system events are unavailable")
+        return False
+
+    # Watch the top level of each directory; organized items live below it
+    collector = ChangeCollector()
+    observer = Observer()
+    try:
+        for directory in [DOWNLOADS_STR, DESKTOP_STR]:
+            observer.schedule(collector, directory, recursive=False)
+        observer.start()
+    except OSError as e:
+        logger.warning(f"Could not watch for file system events: {e}")
+        return False
+
+    workers = [
+        threading.Thread(target=_file_watch_loop, args=(file_manager, collector), daemon=True),
+        threading.Thread(target=_housekeeping_loop, args=(file_manager,), daemon=True),
+        # The watcher may coalesce or drop events, so full scans still run
+        threading.Thread(target=_polling_loop, args=(file_manager,), daemon=True),
+    ]
+    for worker in workers:
+        worker.start()
+
+    # Block until a shutdown signal arrives
+    stop_event.wait()
+
+    observer.stop()
+    collector.changed.set()  # Wake the watch loop so it can exit
+    observer.join()
+    for worker in workers:
+        worker.join()
+    return True
 
 
 def run_daemon():
@@ -43,23 +208,19 @@ def run_daemon():
     # Initialize file manager
     file_manager = FileManager()
 
-    # Main daemon loop
-    while running:
-        try:
-            logger.info("Running scan cycle...")
-            file_manager.run_scan_cycle()
-            logger.info("Scan cycle completed.")
-
-            # Sleep until next cycle, but check for termination regularly
-            for _ in range(SCAN_INTERVAL):
-                if not running:
-                    break
-                time.sleep(1)
-        except Exception as e:
-            logger.error(f"Error in scan cycle: {e}", exc_info=True)
-            # Sleep before retry
-            time.sleep(60)
+    # Organize whatever accumulated while the daemon was not running
+    try:
+        logger.info("Running initial scan cycle...")
+        file_manager.run_scan_cycle()
+        logger.info("Initial scan cycle completed.")
+    except Exception as e:
+        logger.error(f"Error in scan cycle: {e}", exc_info=True)
+
+    if not _watch(file_manager):
+        logger.info(f"Falling back to a full scan every {SCAN_INTERVAL} seconds")
+        _polling_loop(file_manager)
 
+    file_manager.close()
     logger.info("Mac File Organizer daemon stopped.")
 
 
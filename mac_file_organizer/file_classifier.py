@@ -1,6 +1,7 @@
 """
 Logic for classifying files by type.
 """
+import functools
 import logging
 import mimetypes
 # from pathlib import Path
@@ -9,56 +10,99 @@ from mac_file_organizer.config import get_file_categories
 
 logger = logging.getLogger('mac-file-organizer')
 
+# Whether the mimetypes database has been loaded in this process
+_MIME_INITED = False
+
 
 class FileClassifier:
     """Classifies files into categories based on extension and mimetype."""
 
-    def __init__(self):
-        """Initialize the file classifier."""
-        self.categories = get_file_categories()
+    def __init__(self, categories=None):
+        """
+        Initialize the file classifier.
+
+        Args:
+            categories (dict): Category to extensions mapping; loaded from
+                               the configuration when not given
+        """
+        if categories is None:
+            categories = get_file_categories()
 
-        # Ensure mimetypes are initialized
-        mimetypes.init()
+        self.categories = {
+            category: frozenset(extensions)
+            for category, extensions in categories.items()
+        }
+
+        # Reverse lookup from extension to category; the first category listing
+        # an extension wins, as it did when the categories were scanned in order
+        self._ext_to_cat = {}
+        for category, extensions in self.categories.items():
+            for ext in extensions:
+                self._ext_to_cat.setdefault(ext, category)
+
+        # Categories of file suffixes seen so far, as they appear in names
+        self._suffix_to_cat = {}
+
+        # Ensure mimetypes are initialized, once per process
+        global _MIME_INITED
+        if not _MIME_INITED:
+            mimetypes.init()
+            _MIME_INITED = True
 
     def get_categories(self):
         """Return the list of top-level categories."""
         return list(self.categories.keys())
 
+    @functools.cached_property
+    def category_names(self):
+        """Top-level category names as a set, for fast membership checks."""
+        return frozenset(self.categories)
+
     def classify_file(self, file_path):
         """Classify a file into a category."""
+        # The category only depends on the extension, so each one is
+        # resolved once
+        suffix = file_path.suffix
+        category = self._suffix_to_cat.get(suffix)
+        if category is not None:
+            return category
+
         # Get file extension without dot
-        extension = file_path.suffix.lower().lstrip('.')
+        extension = suffix.lower().lstrip('.')
 
-        # Check each category for this extension
-        for category, extensions in self.categories.items():
-            if extension in extensions:
-                return category
-
-        # If no match by extension, try using mimetype
-        try:
-            mime_type, _ = mimetypes.guess_type(file_path)
-            if mime_type:
-                main_type = mime_type.split('/')[0]
-
-                if main_type == 'image':
-                    return 'Images'
-                elif main_type == 'video':
-                    return 'Videos'
-                elif main_type == 'audio':
-                    return 'Audio'
-                elif main_type == 'text':
+        # Look the extension up, falling back to its mimetype
+        category = self._ext_to_cat.get(extension) or _classify_by_mime(extension)
+        self._suffix_to_cat[suffix] = category
+        return category
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_by_mime(extension):
+    """Classify an extension (without dot) by its guessed mimetype."""
+    try:
+        mime_type, _ = mimetypes.guess_type(f"x.{extension}")
+        if mime_type:
+            main_type = mime_type.split('/')[0]
+
+            if main_type == 'image':
+                return 'Images'
+            elif main_type == 'video':
+                return 'Videos'
+            elif main_type == 'audio':
+                return 'Audio'
+            elif main_type == 'text':
+                return 'Documents'
+            elif main_type == 'application':
+                if 'pdf' in mime_type:
+                    return 'Documents'
+                elif any(x in mime_type for x in ['msword', 'office', 'document']):
                     return 'Documents'
-                elif main_type == 'application':
-                    if 'pdf' in mime_type:
-                        return 'Documents'
-                    elif any(x in mime_type for x in ['msword', 'office', 'document']):
-                        return 'Documents'
-                    elif any(x in mime_type for x in ['zip', 'compressed', 'archive']):
-                        return 'Archives'
-                    elif any(x in mime_type for x in ['executable', 'x-app']):
-                        return 'Applications'
-        except Exception as e:
-            logger.warning(f"Error determining mimetype for {file_path}: {e}")
-
-        # Default category
-        return 'Others'
+                elif any(x in mime_type for x in ['zip', 'compressed', 'archive']):
+                    return 'Archives'
+                elif any(x in mime_type for x in ['executable', 'x-app']):
+                    return 'Applications'
+    except Exception as e:
+        logger.warning(f"Error determining mimetype for .{extension} files: {e}")
+
+    # Default category
+    return 'Others'
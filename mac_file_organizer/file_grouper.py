@@ -4,45 +4,291 @@ Group related files based on naming patterns.
 import os
 import re
 import logging
-import difflib
+import functools
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # Fall back to the pure-Python scorer below
+    fuzz = process = None
 
 logger = logging.getLogger('mac-file-organizer')
 
+# What similarity comparisons need to know about a name: its cleaned form
+# and the set of lowercased words of 3+ characters in it
+NameSig = namedtuple('NameSig', ['clean', 'words'])
+
+# Largest bonus added to the similarity of names sharing meaningful words
+_MAX_WORD_BOOST = 0.2
+
+# Patterns stripped from names before comparing them
+_RE_PAREN_NUM = re.compile(r' \(\d+\)')  # " (1)", " (2)", ...
+_RE_VER = re.compile(r' v\d+(\.\d+)?')  # " v1", " v2.1", ...
+_RE_DATE = re.compile(r'20\d{2}[-_]\d{2}[-_]\d{2}')
+_RE_MODIFIERS = re.compile(r' - Copy| copy| final| draft| new')
+
+# Numeric and date prefixes skipped when looking for a business prefix;
+# matched at an offset with Pattern.match(), which anchors them there
+_RE_NUM_PREFIX = re.compile(r'\d+[-_ ]')
+_RE_DATE_PREFIX = re.compile(r'20\d{2}[-_]\d{2}[-_]\d{2}[-_ ]')
+
+# Word pattern used for similarity boosts
+_RE_WORD3 = re.compile(r'\b\w{3,}\b')
+
+
+def _indel_ratio(name1, name2, score_cutoff=0):
+    """
+    Pure-Python equivalent of rapidfuzz's fuzz.ratio.
+
+    The score is the normalized InDel similarity, 2 * LCS / total length,
+    with the longest common subsequence computed bit-parallel over the
+    characters of the first name.
+
+    Args:
+        name1 (str): First name
+        name2 (str): Second name
+        score_cutoff (float): Scores below this are reported as 0
+
+    Returns:
+        float: Similarity score between 0 and 100
+    """
+    total = len(name1) + len(name2)
+    if not total:
+        return 100.0
+
+    # Names of very different lengths can't reach the cutoff
+    if not _can_reach(len(name1), len(name2), score_cutoff):
+        return 0.0
+
+    lcs = 0
+    if name1 and name2:
+        masks = {}
+        for i, char in enumerate(name1):
+            masks[char] = masks.get(char, 0) | (1 << i)
+
+        full = (1 << len(name1)) - 1
+        row = full
+        for char in name2:
+            matches = row & masks.get(char, 0)
+            row = ((row + matches) | (row - matches)) & full
+        lcs = len(name1) - bin(row).count('1')
+
+    score = 200.0 * lcs / total
+    return score if score >= score_cutoff else 0.0
+
+
+def _can_reach(len1, len2, score_cutoff):
+    """
+    Check whether two names of the given lengths could score score_cutoff.
+
+    At best all characters of the shorter name are common to both, so the
+    ratio can't exceed 200 * shorter length / total length.
+
+    Args:
+        len1 (int): Length of the first name
+        len2 (int): Length of the second name
+        score_cutoff (float): Lowest score of interest, between 0 and 100
+
+    Returns:
+        bool: False if the ratio is certainly below score_cutoff
+    """
+    return 200 * min(len1, len2) >= score_cutoff * (len1 + len2)
+
+
+def _token_similarity(words1, words2):
+    """
+    Share of the words of two names that both names contain.
+
+    Args:
+        words1 (frozenset): Words of the first name
+        words2 (frozenset): Words of the second name
+
+    Returns:
+        float: Similarity between 0 and 1
+    """
+    return len(words1 & words2) / max(1, len(words1 | words2))
+
+
+def _contains_entry(directory, want_dir):
+    """
+    Check whether a directory holds at least one subfolder or file.
+
+    DirEntry.is_dir()/is_file() answer from the file type reported by the
+    directory listing itself, so no per-entry stat call is made.
+
+    Args:
+        directory (str): Directory to look into
+        want_dir (bool): Look for a subfolder instead of a file
+
+    Returns:
+        bool: True if a matching entry was found
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            if want_dir:
+                if entry.is_dir(follow_symlinks=False):
+                    return True
+            elif entry.is_file(follow_symlinks=False):
+                return True
+    return False
+
+
+def _strong_match_keys(name_lower):
+    """
+    List every group name that would strongly match a name.
+
+    A group strongly matches a name if it is the whole name, the part before
+    or after a '-' or '_', or a substring that starts and ends on a word
+    boundary, so groups are found with set lookups instead of testing each
+    group in turn.
+
+    Args:
+        name_lower (str): Lowercased file or folder name
+
+    Returns:
+        set: Lowercased group names that strongly match the name
+    """
+    keys = {name_lower}
+    boundaries = []
+    prev_is_word = False
+
+    for i, char in enumerate(name_lower):
+        if char in '-_':
+            keys.add(name_lower[:i])
+            keys.add(name_lower[i + 1:])
+
+        # Same notion of a word character as the \b regex anchor
+        is_word = char.isalnum() or char == '_'
+        if is_word != prev_is_word:
+            boundaries.append(i)
+        prev_is_word = is_word
+
+    if prev_is_word:
+        boundaries.append(len(name_lower))
+
+    for i, start in enumerate(boundaries):
+        for end in boundaries[i + 1:]:
+            keys.add(name_lower[start:end])
+
+    return keys
+
 
 class FileGrouper:
     """Group files based on common patterns and prefixes."""
 
-    def __init__(self):
-        """Initialize the file grouper with patterns and thresholds."""
-        # Common words that should NOT be used for grouping by themselves
-        self.common_words = {
-            'active', 'new', 'copy', 'backup', 'final', 'draft', 'old', 'image',
-            'file', 'document', 'untitled', 'screenshot', 'photo', 'picture',
-            'scan', 'export', 'import', 'temp', 'tmp', 'test', 'sample', 'demo',
-            'menu', 'icon', 'button', 'tile', 'list', 'item', 'header', 'footer',
-            'sidebar', 'navbar', 'panel', 'tab', 'background', 'logo', 'banner'
-        }
-
-        # Date pattern for grouping date-based files
-        self.date_pattern = re.compile(r'(20\d{2}[-_]?\d{2}[-_]?\d{2}|'  # YYYY-MM-DD, YYYY_MM_DD
-                                       r'\d{2}[-_]?\d{2}[-_]?20\d{2}|'  # MM-DD-YYYY, MM_DD_YYYY
-                                       r'\d{8}|'  # YYYYMMDD
-                                       r'17\d{8})')  # Specific timestamp pattern seen in files
+    # Common words that should NOT be used for grouping by themselves
+    COMMON_WORDS = frozenset({
+        'active', 'new', 'copy', 'backup', 'final', 'draft', 'old', 'image',
+        'file', 'document', 'untitled', 'screenshot', 'photo', 'picture',
+        'scan', 'export', 'import', 'temp', 'tmp', 'test', 'sample', 'demo',
+        'menu', 'icon', 'button', 'tile', 'list', 'item', 'header', 'footer',
+        'sidebar', 'navbar', 'panel', 'tab', 'background', 'logo', 'banner'
+    })
+
+    # Matches any common word as a whole word, to strip them in one pass
+    COMMON_WORDS_PATTERN = re.compile(
+        r'\b(?:' + '|'.join(re.escape(w) for w in sorted(COMMON_WORDS)) + r')\b',
+        re.IGNORECASE
+    )
+
+    # Matches anything _clean_name_for_comparison strips, so names with
+    # nothing to strip are recognized in a single pass
+    CLEANUP_PATTERN = re.compile('|'.join(
+        [p.pattern for p in (_RE_PAREN_NUM, _RE_VER, _RE_DATE, _RE_MODIFIERS)] +
+        [f'(?i:{COMMON_WORDS_PATTERN.pattern})']
+    ))
+
+    # Regular expression for finding business/product names, applied with
+    # match() where the name starts
+    BUSINESS_PREFIX_PATTERN = re.compile(r'([A-Za-z0-9]+[-_.][A-Za-z0-9]+|[A-Za-z]{3,})')
 
+    def __init__(self):
+        """Initialize the file grouper with thresholds."""
         # Higher similarity threshold for fuzzy matching to avoid false positives
         self.similarity_threshold = 0.8
 
+        # String similarity scorer (0-100) used for fuzzy matching
+        self._scorer = fuzz.ratio if fuzz is not None else _indel_ratio
+
         # Minimum prefix length to consider for grouping
         self.min_prefix_length = 4
 
-        # Regular expression for finding business/product names
-        self.business_prefix_pattern = re.compile(r'^([A-Za-z0-9]+[-_.][A-Za-z0-9]+|[A-Za-z]{3,})')
-
         # Strict minimum file count to form a group
         self.min_files_for_group = 2
 
+        # Existing groups per (target directory, kind), see build_group_index()
+        self._group_dirs = {}
+
+        # Similarity per pair of names compared so far, see
+        # _calculate_name_similarity()
+        self._similarity_cache = {}
+
+    def reset(self):
+        """Forget all group indexes built so far."""
+        self._group_dirs.clear()
+
+    def clear_similarity_cache(self):
+        """Forget the similarities of all name pairs compared so far."""
+        self._similarity_cache.clear()
+
+    def build_group_index(self, target_dir, want_dir=False):
+        """
+        Index the existing groups in a target directory.
+
+        The directory is listed once and the index is reused by every lookup
+        in that directory until reset() is called.
+
+        Args:
+            target_dir (Path): Directory where groups are located
+            want_dir (bool): Index groups for folders (groups that already
+                             hold a subfolder) instead of groups for files
+
+        Returns:
+            dict: Lowercased group names mapped to (listing position, group name)
+        """
+        groups = {}
+        with os.scandir(target_dir) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+
+                # Skip if group name is just a common word
+                if entry.name.lower() in self.COMMON_WORDS:
+                    continue
+
+                # Only groups that already hold an item of the same kind can take more
+                if _contains_entry(entry.path, want_dir):
+                    groups.setdefault(entry.name.lower(), (len(groups), entry.name))
+
+        self._group_dirs[target_dir, want_dir] = groups
+        return groups
+
+    def _find_group(self, name, target_dir, want_dir):
+        """
+        Look up the existing group a name strongly matches.
+
+        Every name a STRONG match could have is looked up in the group index,
+        and the first matching group in listing order wins.
+
+        Args:
+            name (str): File stem or folder name
+            target_dir (Path): Directory where groups are located
+            want_dir (bool): Whether the name is a folder's
+
+        Returns:
+            str: Group name or "Ungrouped" if no suitable group is found
+        """
+        groups = self._group_dirs.get((target_dir, want_dir))
+        if groups is None:
+            groups = self.build_group_index(target_dir, want_dir)
+
+        matches = [groups[key] for key in _strong_match_keys(name.lower()) if key in groups]
+        if matches:
+            return min(matches)[1]
+
+        return "Ungrouped"
+
     def find_group_for_file(self, file_path, target_dir):
         """
         Find the most appropriate group for a file.
@@ -54,29 +300,8 @@ class FileGrouper:
         Returns:
             str: Group name or "Ungrouped" if no suitable group is found
         """
-        # Extract filename components
-        filename = file_path.name
-        stem = file_path.stem
-        extension = file_path.suffix.lower()
-
         # Only check for existing groups - never suggest new ones
-        for group_dir in target_dir.iterdir():
-            if not group_dir.is_dir():
-                continue
-
-            # Skip if group name is just a common word
-            if group_dir.name.lower() in self.common_words:
-                continue
-
-            # Only add to existing group if there's a STRONG match
-            if self._is_strong_match(stem, group_dir.name):
-                # Check if the group has at least one file already
-                file_count = sum(1 for _ in group_dir.iterdir() if _.is_file())
-                if file_count > 0:
-                    return group_dir.name
-
-        # No suitable existing group found
-        return "Ungrouped"
+        return self._find_group(file_path.stem, target_dir, want_dir=False)
 
     def find_group_for_folder(self, folder_path, target_dir):
         """
@@ -89,179 +314,196 @@ class FileGrouper:
         Returns:
             str: Group name or "Ungrouped" if no suitable group is found
         """
-        # Extract folder name
-        folder_name = folder_path.name
-
         # Only check for existing groups - never suggest new ones
-        for group_dir in target_dir.iterdir():
-            if not group_dir.is_dir():
-                continue
-
-            # Skip if group name is just a common word
-            if group_dir.name.lower() in self.common_words:
-                continue
-
-            # Only add to existing group if there's a STRONG match
-            if self._is_strong_match(folder_name, group_dir.name):
-                # Check if the group has at least one subfolder already
-                subfolder_count = sum(1 for _ in group_dir.iterdir() if _.is_dir())
-                if subfolder_count > 0:
-                    return group_dir.name
-
-        # No suitable group found
-        return "Ungrouped"
+        return self._find_group(folder_path.name, target_dir, want_dir=True)
 
-    def _is_strong_match(self, name, group_name):
+    def add_folder_group(self, folder_path):
         """
-        Determine if a file/folder name strongly matches a group name.
+        Make a folder just moved into a target directory available as a group.
 
-        Args:
-            name (str): File or folder name
-            group_name (str): Group name to compare against
+        Keeps an existing folder group index in step with the directory, as
+        folders with subfolders can take in later folders as groups.
 
-        Returns:
-            bool: True if there's a strong match, False otherwise
+        Args:
+            folder_path (Path): New location of the folder
         """
-        # Convert to lowercase for case-insensitive comparison
-        name_lower = name.lower()
-        group_lower = group_name.lower()
-
-        # 1. Exact name match (case-insensitive)
-        if name_lower == group_lower:
-            return True
-
-        # 2. Strong prefix match (e.g., "document-1" matches group "Document")
-        if (name_lower.startswith(group_lower + '-') or
-            name_lower.startswith(group_lower + '_')):
-            return True
-
-        # 3. Strong suffix match (e.g., "old-document" matches group "Document")
-        if name_lower.endswith('-' + group_lower) or name_lower.endswith('_' + group_lower):
-            return True
-
-        # 4. Complete word match within name (with word boundaries)
-        if re.search(r'\b' + re.escape(group_lower) + r'\b', name_lower):
-            # Verify this isn't just matching a common word
-            if group_lower not in self.common_words:
-                return True
-
-        # No strong match found
-        return False
-
-    def _extract_business_prefix(self, name):
+        groups = self._group_dirs.get((folder_path.parent, True))
+        if groups is None:
+            return
+
+        name_lower = folder_path.name.lower()
+        if (name_lower not in self.COMMON_WORDS and name_lower not in groups and
+                _contains_entry(folder_path, want_dir=True)):
+            groups[name_lower] = (len(groups), folder_path.name)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_business_prefix(name):
         """
         Extract a likely business or product prefix from a filename.
 
+        Results are cached, as the same names are analyzed by several passes.
+
         Args:
             name (str): Filename to analyze
 
         Returns:
             str: Extracted prefix or empty string if none found
         """
-        # Remove any numeric prefixes or date prefixes
-        clean_name = re.sub(r'^\d+[-_ ]', '', name)
-        clean_name = re.sub(r'^20\d{2}[-_]\d{2}[-_]\d{2}[-_ ]', '', clean_name)
+        # Skip any numeric prefixes or date prefixes, without copying the
+        # rest of the name
+        start = 0
+        match = _RE_NUM_PREFIX.match(name)
+        if match:
+            start = match.end()
+        if name.startswith('20', start):
+            match = _RE_DATE_PREFIX.match(name, start)
+            if match:
+                start = match.end()
 
         # Try to extract a business/product prefix
-        match = self.business_prefix_pattern.search(clean_name)
+        match = FileGrouper.BUSINESS_PREFIX_PATTERN.match(name, start)
         if match:
             prefix = match.group(1)
             # Don't use common words as prefixes
-            if prefix.lower() in self.common_words:
+            if prefix.lower() in FileGrouper.COMMON_WORDS:
                 return ""
             return prefix
         return ""
 
-    def _calculate_name_similarity(self, name1, name2):
+    def _calculate_name_similarity(self, name1, name2, sig1=None, sig2=None):
         """
         Calculate similarity between two filenames.
 
+        Scores below the similarity threshold are not exact; they only tell
+        that the names are not similar. Scores depend on the names alone, so
+        each pair is only scored once until clear_similarity_cache() is called.
+
         Args:
             name1 (str): First filename
             name2 (str): Second filename
+            sig1 (NameSig): Signature of name1, if the caller already has it
+            sig2 (NameSig): Signature of name2, if the caller already has it
 
         Returns:
             float: Similarity score between 0 and 1
         """
-        # Clean up names for comparison
-        clean1 = self._clean_name_for_comparison(name1)
-        clean2 = self._clean_name_for_comparison(name2)
+        # The score is symmetric, so both orders share an entry
+        key = (name1, name2) if name1 <= name2 else (name2, name1)
+        similarity = self._similarity_cache.get(key)
+        if similarity is not None:
+            return similarity
 
-        # Calculate similarity ratio
-        similarity = difflib.SequenceMatcher(None, clean1, clean2).ratio()
+        # Clean up names for comparison
+        clean1, words1 = sig1 or self._name_sig(name1)
+        clean2, words2 = sig2 or self._name_sig(name2)
+
+        # Very common words were already stripped by the cleanup
+        meaningful_common_words = words1 & words2
+
+        # Boost similarity for names with common words
+        boost = min(_MAX_WORD_BOOST, 0.05 * len(meaningful_common_words))
+
+        # Names made of (nearly) the same words are similar whatever their
+        # order, which spares the character-level comparison
+        token_similarity = _token_similarity(words1, words2)
+        if token_similarity >= self.similarity_threshold:
+            similarity = token_similarity
+        else:
+            # Calculate similarity ratio; the scorer gives up early (and
+            # scores 0) once the pair can't reach the threshold with the boost
+            score_cutoff = int((self.similarity_threshold - boost) * 100)
+            if _can_reach(len(clean1), len(clean2), score_cutoff):
+                similarity = self._scorer(clean1, clean2, score_cutoff=score_cutoff) / 100
+            else:
+                similarity = 0.0
+
+        similarity = self._similarity_cache[key] = min(1.0, similarity + boost)
+        return similarity
+
+    def _similarity_candidates(self, sig, sigs):
+        """
+        Find names that could be similar enough to group with a name.
 
-        # Boost similarity for names with common prefixes or common words
-        words1 = set(re.findall(r'\b\w{3,}\b', clean1.lower()))
-        words2 = set(re.findall(r'\b\w{3,}\b', clean2.lower()))
+        All candidates are scored in one batched call, and names that cannot
+        reach the similarity threshold even with the word boost are dropped.
+        Names made of (nearly) the same words are kept whatever their
+        characters, as _calculate_name_similarity() scores them by their
+        words alone.
 
-        common_words = words1.intersection(words2)
+        Args:
+            sig (NameSig): Signature of the name to compare
+            sigs (list): Signatures of the names to compare against
 
-        # Don't boost similarity based on very common words
-        meaningful_common_words = common_words - self.common_words
+        Returns:
+            list: Indexes of candidate names, in their original order
+        """
+        clean_name = sig.clean
+        clean_names = [other.clean for other in sigs]
+        score_cutoff = int((self.similarity_threshold - _MAX_WORD_BOOST) * 100)
+        if process is None:
+            candidates = {i for i, other in enumerate(clean_names)
+                          if _can_reach(len(clean_name), len(other), score_cutoff)
+                          and self._scorer(clean_name, other, score_cutoff=score_cutoff)}
+        else:
+            matches = process.extract(clean_name, clean_names, scorer=self._scorer,
+                                      score_cutoff=score_cutoff, limit=None)
+            candidates = {index for _, _, index in matches}
+
+        if sig.words:
+            candidates.update(
+                i for i, other in enumerate(sigs)
+                if not sig.words.isdisjoint(other.words)
+                and _token_similarity(sig.words, other.words) >= self.similarity_threshold)
+        return sorted(candidates)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _name_sig(name):
+        """
+        Build the similarity signature of a filename once.
 
-        if meaningful_common_words:
-            boost = min(0.2, 0.05 * len(meaningful_common_words))
-            similarity += boost
+        Args:
+            name (str): Filename to analyze
 
-        return min(1.0, similarity)
+        Returns:
+            NameSig: Cleaned name and its set of lowercased words
+        """
+        clean = FileGrouper._clean_name_for_comparison(name)
+        return NameSig(clean, frozenset(_RE_WORD3.findall(clean.lower())))
 
-    def _clean_name_for_comparison(self, name):
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _clean_name_for_comparison(name):
         """
         Clean up filename for comparison by removing common suffixes and patterns.
 
+        Results are cached, as every name is compared with many others.
+
         Args:
             name (str): Filename to clean
 
         Returns:
             str: Cleaned filename
         """
+        # Most names have nothing to strip
+        if not FileGrouper.CLEANUP_PATTERN.search(name):
+            return name
+
         # Remove numbers in parentheses like " (1)", " (2)", etc.
-        cleaned = re.sub(r' \(\d+\)', '', name)
+        cleaned = _RE_PAREN_NUM.sub('', name)
 
         # Remove version suffixes like "v1", "v2.1", etc.
-        cleaned = re.sub(r' v\d+(\.\d+)?', '', cleaned)
+        cleaned = _RE_VER.sub('', cleaned)
 
-        # Remove date patterns
-        cleaned = re.sub(r'20\d{2}[-_]\d{2}[-_]\d{2}', '', cleaned)
+        # Remove date patterns (they all start with "20")
+        if '20' in cleaned:
+            cleaned = _RE_DATE.sub('', cleaned)
 
         # Remove common modifiers
-        for modifier in [' - Copy', ' copy', ' final', ' draft', ' new']:
-            cleaned = cleaned.replace(modifier, '')
-
-        return cleaned
-
-    def _extract_group_name(self, filename):
-        """
-        Extract a meaningful group name from a filename.
+        cleaned = _RE_MODIFIERS.sub('', cleaned)
 
-        Args:
-            filename (str): Filename to analyze
+        # Remove very common words so they don't count towards similarity
+        cleaned = FileGrouper.COMMON_WORDS_PATTERN.sub('', cleaned)
 
-        Returns:
-            str: Suggested group name or "Ungrouped" if none found
-        """
-        # Try to extract a business/product name first
-        business_prefix = self._extract_business_prefix(filename)
-        if business_prefix and len(business_prefix) >= self.min_prefix_length and business_prefix.lower() not in self.common_words:
-            return business_prefix.capitalize()
-
-        # Try to extract a meaningful word (at least 4 letters, not a common word)
-        words = re.findall(r'\b[A-Za-z]{4,}\b', filename)
-        for word in words:
-            if word.lower() not in self.common_words:
-                return word.capitalize()
-
-        # Check for hyphenated words or camelCase that could be meaningful
-        hyphenated = re.search(r'([A-Za-z]{3,})[-_]([A-Za-z]{3,})', filename)
-        if hyphenated:
-            compound = f"{hyphenated.group(1)}-{hyphenated.group(2)}"
-            if compound.lower() not in self.common_words:
-                return compound.capitalize()
-
-        # Check for CamelCase
-        camel_case = re.search(r'([A-Z][a-z]{2,})([A-Z][a-z]{2,})', filename)
-        if camel_case:
-            return camel_case.group(0)
-
-        # If all else fails, return "Ungrouped"
-        return "Ungrouped"
+        return cleaned
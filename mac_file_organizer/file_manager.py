@@ -1,28 +1,394 @@
 """
 Core file management logic.
 """
-# import os
+import os
+import bisect
+import errno
 import logging
-# import time
+import time
 # import itertools
 import re  # Added missing import
 import shutil  # Added import for handling app bundles
+import stat
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from mac_file_organizer.config import (
-    DOWNLOADS_DIR, DESKTOP_DIR,
+    DOWNLOADS_DIR, DESKTOP_DIR, DOWNLOADS_STR, DESKTOP_STR,
     MANUAL_FOLDER_NAME, REVIEW_FOLDER_NAME,
-    MANUAL_TAG, REVIEW_TAG
+    MANUAL_TAG, REVIEW_TAG,
+    PARALLEL_MIN_FILES, MOVE_THREADS, PARTIAL_DOWNLOAD_SUFFIXES
 )
 from mac_file_organizer.file_classifier import FileClassifier
 from mac_file_organizer.file_grouper import FileGrouper
 from mac_file_organizer.file_monitor import FileMonitor
 from mac_file_organizer.folder_cleaner import FolderCleaner
+from mac_file_organizer.scan_cache import ScanCache
 from mac_file_organizer.tag_manager import TagManager
 
 logger = logging.getLogger('mac-file-organizer')
 
+# Top-level folders that are never organized
+_SPECIAL_FOLDERS = frozenset([MANUAL_FOLDER_NAME, REVIEW_FOLDER_NAME])
+
+# Words that can name a group; the word boundaries keep letters that run
+# into digits or underscores from counting as a word
+_RE_ALPHA3 = re.compile(r'\b[A-Za-z]{3,}\b')
+
+# What grouping looks at in a filename, worked out once per file: the stem,
+# its lowercase form, its business prefix and its words
+NameFeat = namedtuple('NameFeat', ['stem', 'low', 'prefix', 'words'])
+
+# Grouper of a grouping worker process, see _init_worker()
+_worker_grouper = None
+
+
+def _init_worker():
+    """Set up a grouping worker process."""
+    global _worker_grouper
+    _worker_grouper = FileGrouper()
+
+
+def _split_name(name):
+    """
+    Split a file name into stem and extension like Path.stem and Path.suffix.
+
+    Args:
+        name (str): File name
+
+    Returns:
+        tuple: (stem, extension including the dot or "")
+    """
+    dot = name.rfind('.')
+    if 0 < dot < len(name) - 1:
+        return name[:dot], name[dot:]
+    return name, ""
+
+
+def _claim_name(dst_dir, base_name, extension, is_dir, counter=0, first_suffix=1):
+    """
+    Reserve a free name in a directory with an empty placeholder.
+
+    The placeholder, an empty folder or file, is created atomically, so no
+    other process can take the name between finding it free and using it.
+    A taken name gets a "_N" suffix, as in _safe_move().
+
+    Args:
+        dst_dir (str): Directory to reserve the name in
+        base_name (str): Name to reserve, without extension
+        extension (str): Extension to keep after any suffix
+        is_dir (bool): Whether to reserve the name with a folder
+        counter (int): Suffix number of the name to try first, 0 for none
+        first_suffix (int): Lowest "_N" suffix to try if the name is taken
+
+    Returns:
+        tuple: (reserved path, suffix number used or 0 for none)
+    """
+    while True:
+        name = f"{base_name}_{counter}{extension}" if counter else f"{base_name}{extension}"
+        target = os.path.join(dst_dir, name)
+        try:
+            if is_dir:
+                os.mkdir(target)
+            else:
+                os.close(os.open(target, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+            return target, counter
+        except FileExistsError:
+            counter = max(counter + 1, first_suffix)
+
+
+def _safe_move(src, dst_dir, name, first_suffix=1):
+    """
+    Move a file or folder into a directory without replacing anything there.
+
+    os.rename silently replaces an existing file on macOS, so a file is
+    first hard-linked under its new name, which fails atomically if the
+    name is taken, and only then unlinked from its old location. Folders,
+    and files on volumes without hard links, are moved over a placeholder
+    reserved with _claim_name() instead. A taken name gets a "_N" suffix,
+    before the extension for files.
+
+    Args:
+        src (str): File or folder to move
+        dst_dir (str): Directory to move it into
+        name (str): Preferred name in the destination directory
+        first_suffix (int): Lowest "_N" suffix to try if the name is taken
+
+    Returns:
+        tuple: (new path, suffix number used or 0 if the name was free)
+    """
+    if os.path.isfile(src):
+        base_name, extension = _split_name(name)
+    else:
+        base_name, extension = name, ""
+
+    counter = 0
+    target = os.path.join(dst_dir, name)
+    while True:
+        try:
+            os.link(src, target, follow_symlinks=False)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            raise  # The item or the directory is gone, nothing to fall back to
+        except OSError:
+            break
+        else:
+            try:
+                os.unlink(src)
+            except OSError:
+                os.unlink(target)
+                raise
+            return target, counter
+
+        counter = max(counter + 1, first_suffix)
+        target = os.path.join(dst_dir, f"{base_name}_{counter}{extension}")
+
+    # Hard links are unavailable here; a folder can only be renamed over an
+    # empty folder, anything else over a file
+    is_dir = os.path.isdir(src) and not os.path.islink(src)
+    target, counter = _claim_name(dst_dir, base_name, extension, is_dir, counter, first_suffix)
+    try:
+        os.replace(src, target)
+    except OSError as e:
+        # Give the name up again
+        try:
+            if is_dir:
+                os.rmdir(target)
+            else:
+                os.unlink(target)
+        except OSError:
+            pass
+
+        # Moving to another volume takes a copy
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(src, target)
+    return target, counter
+
+
+def _plan_file(classifier, grouper, file_path, base_dir):
+    """
+    Decide where a file belongs without touching it.
+
+    Args:
+        classifier (FileClassifier): Classifier to categorize the file with
+        grouper (FileGrouper): Grouper to find an existing group with
+        file_path (Path): File to plan
+        base_dir (Path): Directory the file was found in
+
+    Returns:
+        tuple: (category, extension folder name, group name)
+    """
+    # Get category for this file
+    category = classifier.classify_file(file_path)
+
+    # Get subcategory based on file extension
+    extension = file_path.suffix.lstrip('.').upper()
+    if not extension:
+        extension = "Other"
+
+    # Find group for this file; a missing extension folder has no groups yet
+    extension_dir = base_dir / category / extension
+    if extension_dir.is_dir():
+        group = grouper.find_group_for_file(file_path, extension_dir)
+    else:
+        group = "Ungrouped"
+
+    return category, extension, group
+
+
+def find_groups_chunk(chunk):
+    """
+    Identify potential groups for a chunk of extension directories.
+
+    Runs in a worker process set up by _init_worker().
+
+    Args:
+        chunk (list): Lists of the ungrouped files of each extension directory
+
+    Returns:
+        list: Potential groups of each file list, in the same order
+    """
+    # Workers live as long as the file manager, so name similarities are
+    # only kept for one request
+    _worker_grouper.clear_similarity_cache()
+    return [_identify_potential_groups(_worker_grouper, files) for files in chunk]
+
+
+def _identify_potential_groups(grouper, files):
+    """
+    Identify potential groups among a set of files.
+
+    Args:
+        grouper (FileGrouper): Grouper to compare names with
+        files (list): List of file paths, as strings or Path objects
+
+    Returns:
+        dict: Mapping of group names to lists of files
+    """
+    # Dictionary to track potential groups
+    potential_groups = defaultdict(list)
+
+    # First pass - look for obvious prefix groups. The files were just
+    # listed and nothing is moved before the groups are known, so they
+    # are taken as they are
+    stems = {}
+    prefixes = {}
+    for file_path in files:
+        stem = stems[file_path] = _split_name(os.path.basename(file_path))[0]
+
+        # Try to extract a meaningful prefix
+        prefix = prefixes[file_path] = grouper._extract_business_prefix(stem)
+        if prefix and len(prefix) >= grouper.min_prefix_length:
+            # Standardize prefix format
+            group_name = prefix.capitalize()
+            potential_groups[group_name].append(file_path)
+
+    # Second pass - look for similar files
+    # We'll only do this for files not already grouped
+    already_grouped = set()
+    for group_files in potential_groups.values():
+        already_grouped.update(group_files)
+
+    remaining_files = [f for f in files if f not in already_grouped]
+    feats = []
+    for file_path in remaining_files:
+        low = stems[file_path].lower()
+        feats.append(NameFeat(stems[file_path], low, prefixes[file_path], _RE_ALPHA3.findall(low)))
+
+    # Index files by everything a group name could be made of; files that
+    # share none of it can never form a named group together
+    buckets = defaultdict(list)
+    keys = [_group_name_keys(grouper, feat) for feat in feats]
+    for i, file_keys in enumerate(keys):
+        for key in file_keys:
+            buckets[key].append(i)
+
+    # Compare files in pairs, only scoring pairs that could be similar
+    sigs = [grouper._name_sig(feat.stem) for feat in feats]
+    for i, file1 in enumerate(remaining_files):
+        if file1 in already_grouped:
+            continue
+
+        # Buckets list files in order, so later files are found by bisection
+        partners = set()
+        for key in keys[i]:
+            bucket = buckets[key]
+            partners.update(bucket[bisect.bisect_right(bucket, i):])
+        partners = sorted(partners)
+        if not partners:
+            continue
+
+        candidates = grouper._similarity_candidates(
+            sigs[i], [sigs[j] for j in partners])
+        for j in candidates:
+            j = partners[j]
+            file2 = remaining_files[j]
+
+            # Skip if either file was already processed
+            if file1 in already_grouped or file2 in already_grouped:
+                continue
+
+            # Compare names with high similarity threshold
+            similarity = grouper._calculate_name_similarity(
+                feats[i].stem, feats[j].stem, sigs[i], sigs[j])
+
+            if similarity >= grouper.similarity_threshold:
+                # Find a meaningful group name
+                group_name = _find_meaningful_group_name(grouper, feats[i], feats[j])
+
+                # Neither file is in a group yet, see the checks above
+                if group_name != "Ungrouped":
+                    potential_groups[group_name].extend((file1, file2))
+                    already_grouped.update((file1, file2))
+
+    # Remove any groups that don't have enough files
+    return {k: v for k, v in potential_groups.items() if len(v) >= grouper.min_files_for_group}
+
+
+def _group_name_keys(grouper, feat):
+    """
+    List what a file could share with another to get a group name.
+
+    Two files only get a group name from _find_meaningful_group_name if
+    they share one of these keys: the first four letters of the name, a
+    word that isn't a common word, or a business prefix.
+
+    Args:
+        grouper (FileGrouper): Grouper with the grouping settings
+        feat (NameFeat): Name features of the file
+
+    Returns:
+        set: Hashable keys for the file
+    """
+    keys = set()
+    stem = feat.stem
+
+    # Common prefixes of at least four characters (case-insensitive)
+    if len(stem) >= grouper.min_prefix_length:
+        keys.add(('prefix', ''.join(c.lower() for c in stem[:grouper.min_prefix_length])))
+
+    # Common words
+    for word in feat.words:
+        if word not in grouper.COMMON_WORDS:
+            keys.add(('word', word))
+
+    # Business prefix
+    if feat.prefix:
+        keys.add(('business', feat.prefix))
+
+    return keys
+
+
+def _find_meaningful_group_name(grouper, feat1, feat2):
+    """
+    Find a meaningful group name for two similar files.
+
+    Args:
+        grouper (FileGrouper): Grouper with the grouping settings
+        feat1 (NameFeat): Name features of the first file
+        feat2 (NameFeat): Name features of the second file
+
+    Returns:
+        str: A meaningful group name or "Ungrouped"
+    """
+    stem1, low1 = feat1.stem, feat1.low
+    stem2, low2 = feat2.stem, feat2.low
+
+    # Find common prefix; lowercasing keeps ASCII names aligned character by
+    # character, other names are compared one character at a time
+    if stem1.isascii() and stem2.isascii():
+        i = len(os.path.commonprefix([low1, low2]))
+    else:
+        i = 0
+        while i < min(len(stem1), len(stem2)) and stem1[i].lower() == stem2[i].lower():
+            i += 1
+
+    common_prefix = stem1[:i].strip('- _').capitalize()
+    if len(common_prefix) >= grouper.min_prefix_length:
+        # Check if this is just a common word
+        if common_prefix.lower() not in grouper.COMMON_WORDS:
+            return common_prefix
+
+    # Find common substrings
+    common_words = set()
+    for word in feat1.words:
+        if word in feat2.words and word not in grouper.COMMON_WORDS:
+            common_words.add(word.capitalize())
+
+    if common_words:
+        return next(iter(common_words))
+
+    # Try to extract a business/product name
+    if feat1.prefix and feat1.prefix == feat2.prefix:
+        return feat1.prefix.capitalize()
+
+    # If no good name found, return "Ungrouped"
+    return "Ungrouped"
+
 
 class FileManager:
     """Main class for managing file organization."""
@@ -34,12 +400,52 @@ class FileManager:
         self.monitor = FileMonitor()
         self.cleaner = FolderCleaner()
         self.tag_manager = TagManager()
+        self.scan_cache = ScanCache()
+
+        # Folders created or seen during the current cycle, see _ensure_dir()
+        self._known_dirs = set()
+
+        # Next "_N" suffix to try per (folder, name) during the current
+        # cycle, see _move_unique()
+        self._next_suffix = {}
+
+        # Worker processes for grouping, started on first use, see _get_pool()
+        self._pool = None
 
         # Ensure special folders exist and are tagged
         self._initialize_special_folders()
 
+    def close(self):
+        """Finish pending tagging, stop the workers and save the scan cache before shutting down."""
+        self.tag_manager.close()
+        self._shutdown_pool()
+        self.scan_cache.commit()
+
+    def _get_pool(self):
+        """
+        Get the worker processes grouping is spread across.
+
+        The pool is kept until close(), so workers are started and import
+        the package once rather than on every cycle.
+
+        Returns:
+            ProcessPoolExecutor: Pool with one worker per CPU
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker)
+        return self._pool
+
+    def _shutdown_pool(self):
+        """Stop the grouping workers; a later call to _get_pool() starts new ones."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
     def _initialize_special_folders(self):
         """Create and tag special folders if they don't exist."""
+        manual_dirs = []
+        review_dirs = []
+
         for directory in [DOWNLOADS_DIR, DESKTOP_DIR]:
             manual_dir = directory / MANUAL_FOLDER_NAME
             review_dir = directory / REVIEW_FOLDER_NAME
@@ -54,21 +460,36 @@ class FileManager:
                 review_dir.mkdir(exist_ok=True)
                 logger.info(f"Created Review folder at {review_dir}")
 
-            # Apply tags
-            self.tag_manager.apply_tag(manual_dir, MANUAL_TAG)
-            self.tag_manager.apply_tag(review_dir, REVIEW_TAG)
+            manual_dirs.append(manual_dir)
+            review_dirs.append(review_dir)
+
+        # Apply tags, one tag call per tag
+        self.tag_manager.apply_tags_batch(manual_dirs, MANUAL_TAG)
+        self.tag_manager.apply_tags_batch(review_dirs, REVIEW_TAG)
 
     def run_scan_cycle(self):
         """Run a complete scan and organization cycle."""
-        # Process Downloads folder
-        self._process_directory(DOWNLOADS_DIR)
+        # Group directories may have changed since the last cycle, and name
+        # similarities are only kept for the cycle so they can't pile up
+        self.grouper.reset()
+        self.grouper.clear_similarity_cache()
+        self._known_dirs.clear()
+        self._next_suffix.clear()
+
+        # Organize one directory at a time; grouping already spreads its
+        # work over worker processes
+        for directory in [DOWNLOADS_DIR, DESKTOP_DIR]:
+            self._organize_directory(directory)
 
-        # Process Desktop folder
-        self._process_directory(DESKTOP_DIR)
+        self.scan_cache.commit()
 
-        # Smart grouping phase - identify prefixes and group by business/product
-        self._smart_grouping(DOWNLOADS_DIR)
-        self._smart_grouping(DESKTOP_DIR)
+        # Review and cleanup phase
+        self.run_housekeeping()
+
+    def run_housekeeping(self):
+        """Move old files to Review and clean up empty folders."""
+        # Review folders may have been emptied since the last run
+        self._next_suffix.clear()
 
         # Move old files to Review folders
         self._move_to_review()
@@ -76,421 +497,515 @@ class FileManager:
         # Clean up empty folders
         self._clean_empty_folders()
 
+    def process_changes(self, changed_paths):
+        """
+        Organize only the items reported as changed by the file watcher.
+
+        Args:
+            changed_paths (iterable): Paths reported by the file watcher
+        """
+        base_dirs = {DOWNLOADS_STR: DOWNLOADS_DIR, DESKTOP_STR: DESKTOP_DIR}
+        extension_dirs = set()
+
+        # Group directories may have changed since the last batch; name
+        # similarities are only kept for the batch, as the daemon may run for
+        # weeks without another full cycle
+        self.grouper.reset()
+        self.grouper.clear_similarity_cache()
+        self._known_dirs.clear()
+        self._next_suffix.clear()
+
+        for path in changed_paths:
+            # Only top-level items are organized; everything below is ours
+            base_dir = base_dirs.get(os.path.dirname(path))
+            if base_dir is None:
+                continue
+            # Items moved away or deleted since the event are skipped there
+            target_path = self._process_item(Path(path), base_dir)
+
+            # Remember where new files landed so they can be grouped
+            if target_path is not None and target_path.parent.parent.parent == base_dir:
+                extension_dirs.add(target_path.parent)
+
+        for extension_dir in extension_dirs:
+            self._group_extension_dir(extension_dir)
+
+        self.scan_cache.commit()
+
+    def _organize_directory(self, directory):
+        """File the top-level items of a directory, then group the results."""
+        # Process the directory's items
+        self._process_directory(directory)
+
+        # Smart grouping phase - identify prefixes and group by business/product
+        self._smart_grouping(directory)
+
     def _process_directory(self, directory):
         """Process all files in the given directory."""
         logger.info(f"Processing directory: {directory}")
 
-        # Skip special folders
-        special_folders = [MANUAL_FOLDER_NAME, REVIEW_FOLDER_NAME]
+        review_dir = directory / REVIEW_FOLDER_NAME
+        files = []
 
-        for item in directory.iterdir():
-            # Skip special folders and hidden files
-            if (item.name in special_folders or
-                    item.name.startswith('.')):
-                continue
+        for item, is_file, needs_review in self._scan_once(directory):
+            if needs_review:
+                # Stale items go straight to Review instead of being filed first
+                self._move_item_to_review(item, review_dir)
+            elif is_file:
+                # Files are moved together once all of them are planned
+                files.append(item)
+            else:
+                self._process_item(item, directory)
+
+        self._move_files(files, directory)
 
-            # Skip directories that are in our category structure
-            if item.is_dir() and any(item.name == cat for cat in self.classifier.get_categories()):
+    def _scan_once(self, directory):
+        """
+        Gather everything needed to organize a directory's top-level items.
+
+        Each entry is listed once and its access time is checked while its
+        DirEntry is at hand.
+
+        Args:
+            directory (Path): Directory to scan
+
+        Returns:
+            list: (item, is_file, needs_review) tuples
+        """
+        now = time.time()
+        scanned = []
+
+        for entry in self._iter_entries(directory):
+            is_dir = entry.is_dir()
+            if self._should_skip(entry.name, is_dir):
                 continue
 
-            # Process the item
             try:
-                if item.is_file():
-                    self._process_file(item, directory)
-                elif item.is_dir():
-                    self._process_folder(item, directory)
-            except Exception as e:
-                logger.error(f"Error processing {item}: {e}", exc_info=True)
+                needs_review = self.monitor.is_old(entry, now)
+            except OSError as e:
+                logger.error(f"Error checking access time for {entry.path}: {e}")
+                needs_review = False
 
-    def _process_file(self, file_path, base_dir):
-        """Process a single file."""
-        logger.info(f"Processing file: {file_path}")
+            scanned.append((Path(entry.path), entry.is_file(), needs_review))
 
-        # Get category for this file
-        category = self.classifier.classify_file(file_path)
+        return scanned
 
-        # Create category folder if it doesn't exist
-        category_dir = base_dir / category
-        category_dir.mkdir(exist_ok=True)
+    @staticmethod
+    def _iter_entries(directory):
+        """
+        List the entries of a directory with os.scandir.
 
-        # Get subcategory based on file extension
-        extension = file_path.suffix.lstrip('.').upper()
-        if not extension:
-            extension = "Other"
+        DirEntry objects carry the file type from the listing and cache their
+        stat() result, so checking them costs fewer syscalls than Path
+        methods. The listing is read in full before returning so callers can
+        move entries while looping over it.
 
-        # Create extension folder if it doesn't exist
-        extension_dir = category_dir / extension
-        extension_dir.mkdir(exist_ok=True)
+        Args:
+            directory (Path): Directory to list
 
-        # Find group for this file
-        group = self.grouper.find_group_for_file(file_path, extension_dir)
+        Returns:
+            list: os.DirEntry objects for the directory's entries
+        """
+        with os.scandir(directory) as it:
+            return list(it)
 
-        if group == "Ungrouped":
-            # Place the file directly in the extension directory
-            target_path = extension_dir / file_path.name
-        else:
-            # Create group folder if it doesn't exist
-            group_dir = extension_dir / group
-            group_dir.mkdir(exist_ok=True)
-            target_path = group_dir / file_path.name
-
-        # Handle name conflicts
-        if target_path.exists():
-            base_name = file_path.stem
-            extension = file_path.suffix
-            counter = 1
-            while target_path.exists():
-                new_name = f"{base_name}_{counter}{extension}"
-                if group == "Ungrouped":
-                    target_path = extension_dir / new_name
-                else:
-                    target_path = group_dir / new_name
-                counter += 1
-
-        # Move the file
-        file_path.rename(target_path)
-        logger.info(f"Moved {file_path} to {target_path}")
+    def _process_item(self, item, base_dir):
+        """
+        Process a single top-level file or folder.
 
-    def _process_folder(self, folder_path, base_dir):
-        """Process a folder as a single entity."""
-        logger.info(f"Processing folder: {folder_path}")
+        Args:
+            item (Path): File or folder to organize
+            base_dir (Path): Directory the item was found in
 
-        # Folders go to a dedicated 'Folders' category
-        folders_dir = base_dir / "Folders"
-        folders_dir.mkdir(exist_ok=True)
+        Returns:
+            Path: New location of the item, or None if it was not moved
+        """
+        # One stat tells the item's type, or that it was moved away or
+        # deleted in the meantime
+        try:
+            mode = item.stat().st_mode
+        except OSError:
+            return None
+
+        is_dir = stat.S_ISDIR(mode)
+        if self._should_skip(item.name, is_dir):
+            return None
+
+        # Process the item
+        try:
+            if stat.S_ISREG(mode):
+                return self._process_file(item, base_dir)
+            elif is_dir:
+                return self._process_folder(item, base_dir)
+        except Exception as e:
+            logger.error(f"Error processing {item}: {e}", exc_info=True)
+        return None
+
+    def _move_unique(self, src, dst_dir, name):
+        """
+        Move an item with _safe_move, resuming suffixes where the cycle left off.
 
-        # Find group for this folder
-        group = self.grouper.find_group_for_folder(folder_path, folders_dir)
+        When many items with the same name land in one folder, each conflict
+        starts from the last suffix handed out instead of trying "_1", "_2",
+        ... all over again.
 
-        if group == "Ungrouped":
-            # Place the folder directly in the Folders directory
-            target_path = folders_dir / folder_path.name
-        else:
-            # Create group folder if it doesn't exist
-            group_dir = folders_dir / group
-            group_dir.mkdir(exist_ok=True)
-            target_path = group_dir / folder_path.name
-
-        # Handle name conflicts
-        if target_path.exists():
-            base_name = folder_path.name
-            counter = 1
-            while target_path.exists():
-                new_name = f"{base_name}_{counter}"
-                if group == "Ungrouped":
-                    target_path = folders_dir / new_name
-                else:
-                    target_path = group_dir / new_name
-                counter += 1
-
-        # Move the folder
-        folder_path.rename(target_path)
-        logger.info(f"Moved {folder_path} to {target_path}")
+        Args:
+            src (str): File or folder to move
+            dst_dir (str): Directory to move it into
+            name (str): Preferred name in the destination directory
 
-    def _smart_grouping(self, directory):
-        """Intelligently group files based on business/product prefixes and patterns."""
-        logger.info(f"Running smart grouping in: {directory}")
+        Returns:
+            str: New path of the item
+        """
+        key = (dst_dir, name)
+        target, counter = _safe_move(src, dst_dir, name, self._next_suffix.get(key, 1))
+        if counter:
+            self._next_suffix[key] = counter + 1
+        return target
 
-        # Process each category directory
-        for category_dir in directory.iterdir():
-            if not category_dir.is_dir() or category_dir.name in [MANUAL_FOLDER_NAME, REVIEW_FOLDER_NAME]:
-                continue
+    def _ensure_dir(self, directory):
+        """
+        Create a folder, with its parents, unless it is known to exist.
 
-            # Process each extension directory
-            for extension_dir in category_dir.iterdir():
-                if not extension_dir.is_dir():
-                    continue
+        Folders created or found during the current cycle are remembered,
+        along with their parents, so filing many files into the same folder
+        costs a single mkdir call, and a folder whose parent is known is
+        created without checking the parents again. The memory is cleared at
+        the start of every cycle, as folders may be cleaned up or removed in
+        between.
 
-                # Find all ungrouped files (directly in the extension directory)
-                ungrouped_files = [f for f in extension_dir.iterdir() if f.is_file()]
+        Args:
+            directory (str or Path): Folder to create
+        """
+        key = os.fspath(directory)
+        if key in self._known_dirs:
+            return
 
-                if len(ungrouped_files) < self.grouper.min_files_for_group:
-                    continue
+        parent = os.path.dirname(key)
+        if parent in self._known_dirs:
+            try:
+                os.mkdir(key)
+            except FileExistsError:
+                if not os.path.isdir(key):
+                    raise
+        else:
+            os.makedirs(key, exist_ok=True)
 
-                # First analysis - identify potential groups
-                potential_groups = self._identify_potential_groups(ungrouped_files)
-
-                # Only create groups with multiple files
-                for group_name, group_files in potential_groups.items():
-                    if len(group_files) >= self.grouper.min_files_for_group:
-                        # Create group folder
-                        group_dir = extension_dir / group_name
-                        group_dir.mkdir(exist_ok=True)
-
-                        # Move files to group
-                        for file_path in group_files:
-                            if file_path.exists():  # It might have been moved already
-                                target_path = group_dir / file_path.name
-
-                                # Handle name conflicts
-                                if target_path.exists() and target_path != file_path:
-                                    base_name = file_path.stem
-                                    extension = file_path.suffix
-                                    counter = 1
-                                    while target_path.exists() and target_path != file_path:
-                                        new_name = f"{base_name}_{counter}{extension}"
-                                        target_path = group_dir / new_name
-                                        counter += 1
-
-                                try:
-                                    file_path.rename(target_path)
-                                    logger.info(f"Grouped file {file_path} into {group_name}")
-                                except Exception as e:
-                                    logger.error(f"Error moving file {file_path} to group {group_name}: {e}")
-
-    def _identify_potential_groups(self, files):
+            # All of its parents exist now as well
+            while parent not in self._known_dirs and os.path.dirname(parent) != parent:
+                self._known_dirs.add(parent)
+                parent = os.path.dirname(parent)
+        self._known_dirs.add(key)
+
+    def _should_skip(self, name, is_dir):
         """
-        Identify potential groups among a set of files.
+        Check whether a top-level item must be left where it is.
 
         Args:
-            files (list): List of file paths
+            name (str): Name of the item
+            is_dir (bool): Whether the item is a directory
 
         Returns:
-            dict: Mapping of group names to lists of files
+            bool: True for special folders, hidden items, downloads in
+                  progress and category folders
         """
-        # Dictionary to track potential groups
-        potential_groups = defaultdict(list)
+        # Skip special folders and hidden files
+        if name in _SPECIAL_FOLDERS or name.startswith('.'):
+            return True
 
-        # First pass - look for obvious prefix groups
-        for file_path in files:
-            # Skip files that don't exist (might have been moved already)
-            if not file_path.exists():
-                continue
+        # Skip downloads that are still being written
+        if name.lower().endswith(PARTIAL_DOWNLOAD_SUFFIXES):
+            return True
 
-            stem = file_path.stem
+        # Skip directories that are in our category structure
+        return is_dir and name in self.classifier.category_names
 
-            # Try to extract a meaningful prefix
-            prefix = self.grouper._extract_business_prefix(stem)
-            if prefix and len(prefix) >= self.grouper.min_prefix_length:
-                # Standardize prefix format
-                group_name = prefix.capitalize()
-                potential_groups[group_name].append(file_path)
+    def _process_file(self, file_path, base_dir):
+        """Process a single file and return its new location."""
+        moved = self._move_files([file_path], base_dir)
+        return moved[0] if moved else None
 
-        # Second pass - look for similar files
-        # We'll only do this for files not already grouped
-        already_grouped = set()
-        for group_files in potential_groups.values():
-            already_grouped.update(group_files)
+    def _move_files(self, files, base_dir):
+        """
+        Move top-level files into their category, extension and group folders.
 
-        remaining_files = [f for f in files if f not in already_grouped and f.exists()]
+        All destinations are worked out first, so each destination folder is
+        created once however many files go into it, and the moves themselves
+        run on plain strings.
 
-        # Compare files in pairs
-        for i, file1 in enumerate(remaining_files):
-            for file2 in remaining_files[i + 1:]:
-                # Skip if either file was already processed
-                if file1 in already_grouped or file2 in already_grouped:
-                    continue
+        Args:
+            files (list): Files to move
+            base_dir (Path): Directory the files were found in
+
+        Returns:
+            list: New locations of the moved files
+        """
+        base = os.fspath(base_dir)
+        moves = []
+
+        for file_path in files:
+            logger.info(f"Processing file: {file_path}")
 
-                # Compare names with high similarity threshold
-                similarity = self.grouper._calculate_name_similarity(file1.stem, file2.stem)
+            # Get category, extension folder and group for this file
+            try:
+                category, extension, group = _plan_file(self.classifier, self.grouper, file_path, base_dir)
+            except Exception as e:
+                logger.error(f"Error processing {file_path}: {e}", exc_info=True)
+                continue
 
-                if similarity >= self.grouper.similarity_threshold:
-                    # Find a meaningful group name
-                    group_name = self._find_meaningful_group_name(file1, file2)
+            # Place the file in its group folder, or directly in the extension folder
+            dest_dir = os.path.join(base, category, extension)
+            if group != "Ungrouped":
+                dest_dir = os.path.join(dest_dir, group)
+            moves.append((os.fspath(file_path), dest_dir, file_path.name))
 
-                    if group_name != "Ungrouped":
-                        if file1 not in potential_groups[group_name]:
-                            potential_groups[group_name].append(file1)
-                            already_grouped.add(file1)
-                        if file2 not in potential_groups[group_name]:
-                            potential_groups[group_name].append(file2)
-                            already_grouped.add(file2)
+        # Create each destination folder once
+        failed_dirs = set()
+        for dest_dir in {dest_dir for _, dest_dir, _ in moves}:
+            try:
+                self._ensure_dir(dest_dir)
+            except OSError as e:
+                logger.error(f"Error creating folder {dest_dir}: {e}")
+                failed_dirs.add(dest_dir)
+
+        # Move the files. They all come from one directory, so no two of
+        # them share a name and a destination, and the moves can run side
+        # by side on threads
+        moves = [move for move in moves if move[1] not in failed_dirs]
+        if len(moves) < MOVE_THREADS:
+            targets = [self._move_file(*move) for move in moves]
+        else:
+            with ThreadPoolExecutor(max_workers=MOVE_THREADS) as executor:
+                targets = list(executor.map(self._move_file, *zip(*moves)))
 
-        # Remove any groups that don't have enough files
-        return {k: v for k, v in potential_groups.items() if len(v) >= self.grouper.min_files_for_group}
+        return [Path(target) for target in targets if target is not None]
 
-    def _find_meaningful_group_name(self, file1, file2):
+    def _move_file(self, src, dest_dir, name):
         """
-        Find a meaningful group name for two similar files.
+        Move a top-level file into its destination folder.
 
         Args:
-            file1 (Path): First file
-            file2 (Path): Second file
+            src (str): File to move
+            dest_dir (str): Folder to move it into
+            name (str): Preferred name in the folder
 
         Returns:
-            str: A meaningful group name or "Ungrouped"
+            str: New path of the file, or None if it could not be moved
         """
-        stem1 = file1.stem
-        stem2 = file2.stem
+        try:
+            target = self._move_unique(src, dest_dir, name)
+        except OSError as e:
+            logger.error(f"Error processing {src}: {e}")
+            return None
+        logger.info(f"Moved {src} to {target}")
+        return target
 
-        # Find common prefix
-        i = 0
-        while i < min(len(stem1), len(stem2)) and stem1[i].lower() == stem2[i].lower():
-            i += 1
+    def _process_folder(self, folder_path, base_dir):
+        """Process a folder as a single entity and return its new location."""
+        logger.info(f"Processing folder: {folder_path}")
 
-        common_prefix = stem1[:i].strip('- _').capitalize()
-        if len(common_prefix) >= self.grouper.min_prefix_length:
-            # Check if this is just a common word
-            if common_prefix.lower() not in self.grouper.common_words:
-                return common_prefix
+        # Folders go to a dedicated 'Folders' category
+        folders_dir = base_dir / "Folders"
+        self._ensure_dir(folders_dir)
 
-        # Find common substrings
-        common_words = set()
-        words1 = re.findall(r'\b[A-Za-z]{3,}\b', stem1.lower())
-        words2 = re.findall(r'\b[A-Za-z]{3,}\b', stem2.lower())
+        # Find group for this folder
+        group = self.grouper.find_group_for_folder(folder_path, folders_dir)
 
-        for word in words1:
-            if word in words2 and word not in self.grouper.common_words:
-                common_words.add(word.capitalize())
+        if group == "Ungrouped":
+            # Place the folder directly in the Folders directory
+            dest_dir = folders_dir
+        else:
+            # Create group folder if it doesn't exist
+            dest_dir = folders_dir / group
+            self._ensure_dir(dest_dir)
 
-        if common_words:
-            return next(iter(common_words))
+        # Move the folder, renaming it on name conflicts
+        target_path = Path(self._move_unique(os.fspath(folder_path), os.fspath(dest_dir), folder_path.name))
+        logger.info(f"Moved {folder_path} to {target_path}")
 
-        # Try to extract a business/product name
-        prefix1 = self.grouper._extract_business_prefix(stem1)
-        prefix2 = self.grouper._extract_business_prefix(stem2)
+        # The folder can now act as a group for folders that follow
+        if group == "Ungrouped":
+            self.grouper.add_folder_group(target_path)
+        return target_path
 
-        if prefix1 and prefix1 == prefix2:
-            return prefix1.capitalize()
+    def _smart_grouping(self, directory):
+        """Intelligently group files based on business/product prefixes and patterns."""
+        logger.info(f"Running smart grouping in: {directory}")
 
-        # If no good name found, return "Ungrouped"
-        return "Ungrouped"
+        # Collect the extension directories that need grouping
+        jobs = []
+        for category_entry in self._iter_entries(directory):
+            if not category_entry.is_dir() or category_entry.name in _SPECIAL_FOLDERS:
+                continue
 
-    def _group_by_prefixes(self, files, extension_dir):
-        """Group files by their business/vendor prefixes."""
-        # Group files by prefix
-        prefix_groups = defaultdict(list)
+            # Process each extension directory
+            for extension_entry in self._iter_entries(category_entry.path):
+                if not extension_entry.is_dir():
+                    continue
 
-        for file_path in files:
-            prefix = self.grouper._extract_business_prefix(file_path.stem)
-            if prefix:
-                prefix_groups[prefix.lower()].append(file_path)
+                job = self._grouping_job(Path(extension_entry.path))
+                if job is not None:
+                    jobs.append(job)
 
-        # Create folders for prefix groups with multiple files
-        for prefix, group_files in prefix_groups.items():
-            # Only create a group if there are AT LEAST 2 FILES
-            if len(group_files) >= self.grouper.min_files_for_group:
-                # Create a folder with the prefix name
-                group_dir = extension_dir / prefix.capitalize()
-                group_dir.mkdir(exist_ok=True)
-
-                # Move files to the group folder
-                for file_path in group_files:
-                    if file_path.exists():  # It might have been moved already
-                        target_path = group_dir / file_path.name
-
-                        # Handle name conflicts
-                        if target_path.exists() and target_path != file_path:
-                            base_name = file_path.stem
-                            extension = file_path.suffix
-                            counter = 1
-                            while target_path.exists() and target_path != file_path:
-                                new_name = f"{base_name}_{counter}{extension}"
-                                target_path = group_dir / new_name
-                                counter += 1
-
-                        try:
-                            file_path.rename(target_path)
-                            logger.info(f"Grouped file {file_path} into {prefix} group")
-                        except Exception as e:
-                            logger.error(f"Error moving file {file_path} to group {prefix}: {e}")
-
-    def _group_by_date_patterns(self, files, extension_dir):
-        """Group files by common date patterns in their names."""
-        # Dictionary to track date-based groups
-        date_groups = defaultdict(list)
-
-        # Find files with the same date
-        for file_path in files:
-            date_match = self.grouper.date_pattern.search(file_path.stem)
-            if date_match:
-                date_value = date_match.group(0)
-                date_groups[date_value].append(file_path)
-
-        # Process date groups with multiple files
-        for date_value, group_files in date_groups.items():
-            # Only create a group if there are AT LEAST 2 FILES
-            if len(group_files) >= self.grouper.min_files_for_group:
-                # Check if these files also have common prefixes
-                prefixes = [self.grouper._extract_business_prefix(f.stem) for f in group_files]
-                prefixes = [p for p in prefixes if p]
+        # Extension directories are independent; find all groups first, then
+        # move the files here
+        all_groups = self._find_groups([files for _, _, files in jobs])
+        for (extension_dir, state, _), potential_groups in zip(jobs, all_groups):
+            self._apply_groups(extension_dir, state, potential_groups)
 
-                # If they have different prefixes, don't group them just because of the date
-                if len(set(prefixes)) > 1:
-                    continue
+    def _group_extension_dir(self, extension_dir):
+        """Group the ungrouped files of a single extension directory."""
+        job = self._grouping_job(extension_dir)
+        if job is not None:
+            _, state, files = job
+            self._apply_groups(extension_dir, state, _identify_potential_groups(self.grouper, files))
 
-                # Create a date-based group
-                group_dir = extension_dir / f"Date-{date_value}"
-                group_dir.mkdir(exist_ok=True)
-
-                # Move files to the group folder
-                for file_path in group_files:
-                    if file_path.exists():  # It might have been moved already
-                        target_path = group_dir / file_path.name
-
-                        # Handle name conflicts
-                        if target_path.exists() and target_path != file_path:
-                            base_name = file_path.stem
-                            extension = file_path.suffix
-                            counter = 1
-                            while target_path.exists() and target_path != file_path:
-                                new_name = f"{base_name}_{counter}{extension}"
-                                target_path = group_dir / new_name
-                                counter += 1
-
-                        try:
-                            file_path.rename(target_path)
-                            logger.info(f"Grouped file {file_path} into date group Date-{date_value}")
-                        except Exception as e:
-                            logger.error(f"Error moving file {file_path} to date group Date-{date_value}: {e}")
-
-    def _group_similar_files(self, files, extension_dir):
-        """Group similar files based on name similarity."""
-        # Dictionary to track groups
-        potential_groups = {}
-
-        # Compare files in pairs
-        for i, file1 in enumerate(files):
-            for file2 in files[i + 1:]:
-                # Skip if either file was already processed and no longer exists
-                if not file1.exists() or not file2.exists():
-                    continue
+    def _grouping_job(self, extension_dir):
+        """
+        Gather what is needed to group an extension directory.
+
+        Args:
+            extension_dir (Path): Extension directory to group
+
+        Returns:
+            tuple: (extension_dir, directory state, ungrouped file paths), or None
+                   if the directory hasn't changed since it was grouped; the
+                   files are left out if there are too few to group
+        """
+        # Skip directories whose entries haven't changed since they were grouped
+        state = self.scan_cache.get_state(extension_dir)
+        if self.scan_cache.is_unchanged(state):
+            return None
+
+        # Find all ungrouped files (directly in the extension directory); they
+        # are only ever looked at by name, so plain path strings will do
+        ungrouped = [entry.path for entry in self._iter_entries(extension_dir) if entry.is_file()]
+        if len(ungrouped) < self.grouper.min_files_for_group:
+            return extension_dir, state, []
+        return extension_dir, state, ungrouped
+
+    def _find_groups(self, file_lists):
+        """
+        Identify potential groups for many extension directories at once.
 
-                # Compare names
-                similarity = self.grouper._calculate_name_similarity(file1.stem, file2.stem)
+        Name comparisons are CPU-bound, so with enough files the directories
+        are spread across worker processes.
 
-                if similarity >= self.grouper.similarity_threshold:
-                    # Extract a meaningful group name
-                    group_name = self.grouper._extract_group_name(file1.stem)
+        Args:
+            file_lists (list): Ungrouped files of each extension directory
+
+        Returns:
+            list: Potential groups of each file list, in the same order
+        """
+        # Too few files to form any group
+        min_files = self.grouper.min_files_for_group
+        pending = [i for i, files in enumerate(file_lists) if len(files) >= min_files]
+        all_groups = [{} for _ in file_lists]
+
+        # A single CPU or directory gains nothing from workers, and small
+        # batches cost more to hand over than to group here
+        workers = min(os.cpu_count() or 1, len(pending))
+        if workers <= 1 or sum(len(file_lists[i]) for i in pending) < PARALLEL_MIN_FILES:
+            for i in pending:
+                all_groups[i] = _identify_potential_groups(self.grouper, file_lists[i])
+            return all_groups
+
+        chunks = [pending[i::workers] for i in range(workers)]
+        done = set()
+
+        try:
+            executor = self._get_pool()
+            futures = [(chunk, executor.submit(find_groups_chunk, [file_lists[i] for i in chunk]))
+                       for chunk in chunks]
+            for chunk, future in futures:
+                try:
+                    for i, potential_groups in zip(chunk, future.result()):
+                        all_groups[i] = potential_groups
+                        done.add(i)
+                except BrokenProcessPool as e:
+                    # A worker died; start new ones next time
+                    logger.warning(f"Grouping workers stopped, grouping files serially: {e}")
+                    self._shutdown_pool()
+                    break
+                except Exception as e:
+                    logger.warning(f"Error grouping files in worker, grouping them serially: {e}")
+        except Exception as e:
+            logger.warning(f"Could not group files in parallel: {e}")
+            self._shutdown_pool()
 
-                    if group_name != "Ungrouped" and group_name not in potential_groups:
-                        potential_groups[group_name] = []
+        for i in pending:
+            if i not in done:
+                all_groups[i] = _identify_potential_groups(self.grouper, file_lists[i])
+        return all_groups
 
-                    # Add both files if they're not already in the group
-                    if group_name != "Ungrouped":
-                        if file1 not in potential_groups[group_name]:
-                            potential_groups[group_name].append(file1)
-                        if file2 not in potential_groups[group_name]:
-                            potential_groups[group_name].append(file2)
+    def _apply_groups(self, extension_dir, state, potential_groups):
+        """
+        Move files into the groups found for an extension directory.
 
-        # Create groups
+        Args:
+            extension_dir (Path): Extension directory being grouped
+            state (tuple): Directory state from before grouping
+            potential_groups (dict): Mapping of group names to lists of files
+        """
+        moved = set()
+
+        # Only create groups with multiple files
         for group_name, group_files in potential_groups.items():
-            # Only create a group if there are AT LEAST 2 FILES
             if len(group_files) >= self.grouper.min_files_for_group:
-                # Create the group folder
+                # Create group folder
                 group_dir = extension_dir / group_name
-                group_dir.mkdir(exist_ok=True)
-
-                # Move the files to the group folder
-                for file_path in group_files:
-                    if file_path.exists():  # It might have been moved already
-                        target_path = group_dir / file_path.name
-
-                        # Handle name conflicts
-                        if target_path.exists() and target_path != file_path:
-                            base_name = file_path.stem
-                            extension = file_path.suffix
-                            counter = 1
-                            while target_path.exists() and target_path != file_path:
-                                new_name = f"{base_name}_{counter}{extension}"
-                                target_path = group_dir / new_name
-                                counter += 1
-
-                        try:
-                            file_path.rename(target_path)
-                            logger.info(f"Grouped file {file_path} into {group_name}")
-                        except Exception as e:
-                            logger.error(f"Error moving file {file_path} to group {group_name}: {e}")
+                self._ensure_dir(group_dir)
+
+                # Move files to group
+                self._move_into_group(group_files, group_dir, moved)
+
+        # Only a directory left untouched by grouping is known to be fully grouped
+        if not potential_groups:
+            self.scan_cache.mark_grouped(state)
+
+    def _move_into_group(self, group_files, group_dir, moved):
+        """
+        Move files into an existing group folder.
+
+        The folder is listed once, so free names for conflicting files are
+        found without checking the file system for every candidate name.
+
+        Args:
+            group_files (list): Files to move, as strings or Path objects
+            group_dir (Path): Group folder to move them into
+            moved (set): Paths (as strings) already moved by the caller;
+                         files in it are skipped and moved files are added
+        """
+        group_dir_str = os.fspath(group_dir)
+        used_names = {entry.name for entry in self._iter_entries(group_dir)}
+
+        for file_path in group_files:
+            src = os.fspath(file_path)
+            if src in moved:  # It might have been moved already
+                continue
+
+            # Handle name conflicts
+            name = os.path.basename(src)
+            if name in used_names:
+                key = (group_dir_str, name)
+                stem, extension = _split_name(name)
+                counter = self._next_suffix.get(key, 1)
+                while name in used_names:
+                    name = f"{stem}_{counter}{extension}"
+                    counter += 1
+                self._next_suffix[key] = counter
+
+            try:
+                target, _ = _safe_move(src, group_dir_str, name)
+            except FileNotFoundError:
+                continue  # Removed since it was listed
+            except Exception as e:
+                logger.error(f"Error moving file {file_path} to group {group_dir.name}: {e}")
+                continue
+
+            used_names.add(os.path.basename(target))
+            moved.add(src)
+            logger.info(f"Grouped file {file_path} into {group_dir.name}")
 
     def _move_to_review(self):
         """Move files not accessed for over 2 weeks to Review folder."""
@@ -499,44 +1014,59 @@ class FileManager:
         for base_dir in [DOWNLOADS_DIR, DESKTOP_DIR]:
             review_dir = base_dir / REVIEW_FOLDER_NAME
 
-            # Get list of old files
-            old_files = self.monitor.get_old_files(base_dir)
-
-            # Move each old file to Review
-            for file_path in old_files:
+            # Move each old file to Review as the scan finds it
+            for path, is_dir in self.monitor.iter_old_entries(base_dir):
                 # Skip special folders
-                if (file_path.parent.name == MANUAL_FOLDER_NAME or
-                        file_path.parent.name == REVIEW_FOLDER_NAME):
+                if os.path.basename(os.path.dirname(path)) in _SPECIAL_FOLDERS:
                     continue
 
-                target_path = review_dir / file_path.name
-
-                # Handle name conflicts
-                if target_path.exists():
-                    base_name = file_path.stem if file_path.is_file() else file_path.name
-                    extension = file_path.suffix if file_path.is_file() else ""
-                    counter = 1
-                    while target_path.exists():
-                        if file_path.is_file():
-                            new_name = f"{base_name}_{counter}{extension}"
-                        else:
-                            new_name = f"{base_name}_{counter}"
-                        target_path = review_dir / new_name
-                        counter += 1
+                self._move_item_to_review(Path(path), review_dir, is_dir)
 
+    def _move_item_to_review(self, file_path, review_dir, is_dir=None):
+        """
+        Move a single file or folder into a Review folder.
+
+        Args:
+            file_path (Path): File or folder to move
+            review_dir (Path): Review folder to move it into
+            is_dir (bool): Whether the item is a folder, if already known
+        """
+        try:
+            if is_dir is None:
+                is_dir = file_path.is_dir()
+
+            # Special handling for .app directories
+            if is_dir and file_path.name.endswith('.app'):
+                # Reserve a free name, renaming the bundle on name conflicts;
+                # suffixes resume where the last bundle of that name left off
+                review_dir_str = os.fspath(review_dir)
+                key = (review_dir_str, file_path.name)
+                target_path, counter = _claim_name(review_dir_str, file_path.name, "", True,
+                                                   first_suffix=self._next_suffix.get(key, 1))
+                if counter:
+                    self._next_suffix[key] = counter + 1
+
+                # Rename the bundle over the reserved folder in one call
                 try:
-                    # Special handling for .app directories
-                    if file_path.is_dir() and str(file_path).endswith('.app'):
-                        # Use shutil for app bundles
-                        shutil.copytree(file_path, target_path, symlinks=True)
-                        shutil.rmtree(file_path)
-                        logger.info(f"Moved application bundle {file_path} to Review: {target_path}")
-                    else:
-                        # Move the file or folder using regular rename
-                        file_path.rename(target_path)
-                        logger.info(f"Moved {file_path} to Review: {target_path}")
-                except Exception as e:
-                    logger.error(f"Error moving {file_path} to Review: {e}")
+                    os.replace(file_path, target_path)
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        os.rmdir(target_path)
+                        raise
+
+                    # Use shutil for app bundles on another volume;
+                    # shutil.copy keeps permission bits, which is all a
+                    # bundle needs, without copying every file's timestamps
+                    shutil.copytree(file_path, target_path, symlinks=True, dirs_exist_ok=True,
+                                    copy_function=shutil.copy)
+                    shutil.rmtree(file_path)
+                logger.info(f"Moved application bundle {file_path} to Review: {target_path}")
+            else:
+                # Move the file or folder, renaming it on name conflicts
+                target_path = self._move_unique(os.fspath(file_path), os.fspath(review_dir), file_path.name)
+                logger.info(f"Moved {file_path} to Review: {target_path}")
+        except Exception as e:
+            logger.error(f"Error moving {file_path} to Review: {e}")
 
     def _clean_empty_folders(self):
         """Clean up empty folders."""
@@ -4,7 +4,6 @@ Monitoring file access times.
 import os
 import time
 import logging
-from pathlib import Path
 
 from mac_file_organizer.config import (
     REVIEW_THRESHOLD, MANUAL_FOLDER_NAME, REVIEW_FOLDER_NAME
@@ -20,53 +19,80 @@ class FileMonitor:
         """Initialize the file monitor."""
         pass
 
-    def get_old_files(self, directory):
-        """Get files that haven't been accessed in the threshold period."""
-        old_files = []
-        now = time.time()
+    def is_old(self, entry, now=None):
+        """
+        Check whether a directory entry hasn't been accessed in the threshold period.
 
-        # Define special folders to ignore
-        special_folders = [directory / MANUAL_FOLDER_NAME, directory / REVIEW_FOLDER_NAME]
+        Args:
+            entry (os.DirEntry): Entry to check
+            now (float): Current time, to share one timestamp across a scan
 
-        # Recursively scan the directory
-        for root, dirs, files in os.walk(directory):
-            root_path = Path(root)
+        Returns:
+            bool: True if the entry is old enough to be reviewed
+        """
+        if now is None:
+            now = time.time()
+        return now - entry.stat(follow_symlinks=False).st_atime > REVIEW_THRESHOLD
 
-            # Skip special folders and app bundle internals
-            if (any(str(root_path).startswith(str(folder)) for folder in special_folders) or
-                (".app/" in str(root_path) or ".app\\" in str(root_path))):
-                continue
+    def iter_old_entries(self, directory):
+        """
+        Yield files and folders that haven't been accessed in the threshold period.
 
-            # Check each file
-            for filename in files:
-                file_path = root_path / filename
+        Each folder is listed in full before its old entries are yielded, so
+        callers may move them away while iterating; folders that are gone
+        by the time they are reached are skipped.
 
-                try:
-                    # Get last access time
-                    atime = file_path.stat().st_atime
+        Args:
+            directory (Path): Directory to scan recursively
 
-                    # Check if file is old enough
-                    if now - atime > REVIEW_THRESHOLD:
-                        old_files.append(file_path)
-                except Exception as e:
-                    logger.error(f"Error checking access time for {file_path}: {e}")
+        Yields:
+            tuple: (path, is_dir) of each old entry, with path as a string
+        """
+        now = time.time()
 
-            # Check each directory (except top-level category dirs)
-            for dirname in dirs:
-                dir_path = root_path / dirname
+        # Define special folders to ignore
+        special_folders = (str(directory / MANUAL_FOLDER_NAME), str(directory / REVIEW_FOLDER_NAME))
+        top_level = str(directory)
+
+        def is_skipped(path):
+            """Check whether a folder is special or inside an app bundle."""
+            return path.startswith(special_folders) or ".app/" in path or ".app\\" in path
+
+        # Recursively scan the directory; DirEntry.stat() avoids building a
+        # Path object and re-resolving it for every entry. Skipped folders
+        # are never entered, as nothing below them is checked
+        pending = [top_level]
+        while pending:
+            root = pending.pop()
+
+            try:
+                with os.scandir(root) as it:
+                    entries = list(it)
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                logger.error(f"Error scanning {root}: {e}")
+                continue
+
+            subdirs = []
+            old_entries = []
+            for entry in entries:
+                is_dir = entry.is_dir()
+                if is_dir and not entry.is_symlink() and not is_skipped(entry.path):
+                    subdirs.append(entry.path)
 
                 # Skip top-level category directories and hidden directories
-                if root_path == directory or dirname.startswith('.'):
+                if is_dir and (root == top_level or entry.name.startswith('.')):
                     continue
 
                 try:
-                    # Get last access time
-                    atime = dir_path.stat().st_atime
-
-                    # Check if directory is old enough
-                    if now - atime > REVIEW_THRESHOLD:
-                        old_files.append(dir_path)
+                    # Check if file or directory is old enough
+                    if self.is_old(entry, now):
+                        old_entries.append((entry.path, is_dir))
                 except Exception as e:
-                    logger.error(f"Error checking access time for directory {dir_path}: {e}")
+                    logger.error(f"Error checking access time for {entry.path}: {e}")
+
+            # Visit subdirectories in listing order
+            pending.extend(reversed(subdirs))
 
-        return old_files
+            yield from old_entries
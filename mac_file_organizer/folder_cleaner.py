@@ -1,6 +1,8 @@
 """
 Logic for removing empty folders.
 """
+import os
+import errno
 import logging
 # from pathlib import Path
 
@@ -23,32 +25,24 @@ class FolderCleaner:
         # Define special folders to ignore
         special_folders = [MANUAL_FOLDER_NAME, REVIEW_FOLDER_NAME]
 
-        # Track if folders were deleted
-        folders_deleted = True
-
-        # Keep cleaning until no more empty folders are found
-        while folders_deleted:
-            folders_deleted = False
-
-            # Get all subdirectories
-            all_dirs = [d for d in directory.glob('**/*') if d.is_dir()]
-
-            # Sort by depth (deepest first)
-            all_dirs.sort(key=lambda d: len(d.parts), reverse=True)
-
-            for dir_path in all_dirs:
+        # Walk the tree bottom-up, so a folder is only checked once all of
+        # its subfolders have been cleaned and it is seen empty in one pass
+        for root, dirs, _ in os.walk(directory, topdown=False):
+            for name in dirs:
                 # Skip special folders
-                if dir_path.name in special_folders:
+                if name in special_folders:
                     continue
 
-                # Skip if the directory is not empty
-                if any(dir_path.iterdir()):
+                # Links to folders are never removed or descended into
+                dir_path = os.path.join(root, name)
+                if os.path.islink(dir_path):
                     continue
 
-                # It's an empty directory, delete it
+                # rmdir only removes empty directories, so there is no need
+                # to list the directory first
                 try:
-                    dir_path.rmdir()
+                    os.rmdir(dir_path)
                     logger.info(f"Removed empty folder: {dir_path}")
-                    folders_deleted = True
-                except Exception as e:
-                    logger.error(f"Error removing empty folder {dir_path}: {e}")
\ No newline at end of file
+                except OSError as e:
+                    if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                        logger.error(f"Error removing empty folder {dir_path}: {e}")
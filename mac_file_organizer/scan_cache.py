@@ -0,0 +1,81 @@
+"""
+Persistent cache of directories that are already fully grouped.
+"""
+import os
+import logging
+import sqlite3
+
+from mac_file_organizer.config import SCAN_CACHE_PATH
+
+logger = logging.getLogger('mac-file-organizer')
+
+# Number of pending writes after which the cache is committed
+COMMIT_BATCH_SIZE = 500
+
+
+class ScanCache:
+    """Remembers directories whose contents haven't changed since they were grouped."""
+
+    def __init__(self, path=SCAN_CACHE_PATH):
+        """Open (or create) the cache database."""
+        self._pending = 0
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS grouped_dirs ("
+                "dev INTEGER, ino INTEGER, mtime INTEGER, "
+                "PRIMARY KEY (dev, ino))"
+            )
+            self._conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Scan cache unavailable, directories will always be regrouped: {e}")
+            self._conn = None
+
+    def get_state(self, directory):
+        """
+        Get the identity and modification time of a directory.
+
+        A directory's mtime changes whenever entries are added, removed or
+        renamed in it, which is all that grouping depends on.
+
+        Args:
+            directory (Path): Directory to inspect
+
+        Returns:
+            tuple: (st_dev, st_ino, st_mtime_ns)
+        """
+        st = os.stat(directory)
+        return st.st_dev, st.st_ino, st.st_mtime_ns
+
+    def is_unchanged(self, state):
+        """Check whether a directory state was already recorded as grouped."""
+        if self._conn is None:
+            return False
+
+        row = self._conn.execute(
+            "SELECT mtime FROM grouped_dirs WHERE dev = ? AND ino = ?", state[:2]
+        ).fetchone()
+        return row is not None and row[0] == state[2]
+
+    def mark_grouped(self, state):
+        """Record a directory state as fully grouped."""
+        if self._conn is None:
+            return
+
+        self._conn.execute("INSERT OR REPLACE INTO grouped_dirs VALUES (?, ?, ?)", state)
+        self._pending += 1
+        if self._pending >= COMMIT_BATCH_SIZE:
+            self.commit()
+
+    def commit(self):
+        """Write pending cache entries to disk."""
+        if self._conn is None or not self._pending:
+            return
+
+        try:
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Error saving scan cache: {e}")
+        self._pending = 0
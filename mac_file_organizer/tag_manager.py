@@ -1,80 +1,429 @@
 """
 Managing macOS file tags.
 """
+import os
+import sys
+import errno
+import ctypes
+import ctypes.util
+import functools
 import logging
+import plistlib
+import queue
+import shlex
+import shutil
 import subprocess
+import threading
+from collections import namedtuple
 # from pathlib import Path
 
-from mac_file_organizer.config import MANUAL_TAG_COLOR, REVIEW_TAG_COLOR
+from mac_file_organizer.config import (
+    MANUAL_TAG, REVIEW_TAG, MANUAL_TAG_COLOR, REVIEW_TAG_COLOR
+)
 
 logger = logging.getLogger('mac-file-organizer')
 
+# Most paths passed to a single tag call, well below the argument size limit
+TAG_BATCH_SIZE = 100
+
+# Extended attribute Finder keeps a file's tags in, as a binary plist of
+# "name\ncolor index" strings
+_TAG_XATTR = b"com.apple.metadata:_kMDItemUserTags"
+
+# Error getxattr() reports for a path without the attribute (macOS only)
+_ENOATTR = getattr(errno, "ENOATTR", errno.ENODATA)
+
+# Finder color indexes by color name
+_COLOR_INDEXES = {
+    "none": 0, "gray": 1, "green": 2, "purple": 3,
+    "blue": 4, "yellow": 5, "red": 6, "orange": 7,
+}
+
+# How a tag is written: its color, the "name,color" argument of the tag
+# command and the "name\ncolor index" entry of the tags attribute
+TagSpec = namedtuple('TagSpec', ['color', 'arg', 'entry'])
+
+
+def _make_tag_spec(tag_name, tag_color):
+    """Build the TagSpec of a tag with the given color."""
+    return TagSpec(tag_color, f"{tag_name},{tag_color}",
+                   f"{tag_name}\n{_COLOR_INDEXES.get(tag_color, 0)}")
+
+
+# Specs of the tags the organizer uses; other tags get the Review color
+_TAG_SPEC = {
+    MANUAL_TAG: _make_tag_spec(MANUAL_TAG, MANUAL_TAG_COLOR),
+    REVIEW_TAG: _make_tag_spec(REVIEW_TAG, REVIEW_TAG_COLOR),
+}
+
+
+def _load_xattr_functions():
+    """
+    Look up getxattr() and setxattr() in the macOS C library.
+
+    Returns:
+        tuple: (getxattr, setxattr), both taking (path, name, value, size,
+               position, options), or (None, None) if they are unavailable
+    """
+    if sys.platform != "darwin":
+        return None, None
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        getxattr, setxattr = libc.getxattr, libc.setxattr
+    except (OSError, AttributeError):
+        return None, None
+
+    getxattr.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_void_p,
+                         ctypes.c_size_t, ctypes.c_uint32, ctypes.c_int]
+    getxattr.restype = ctypes.c_ssize_t
+    setxattr.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_char_p,
+                         ctypes.c_size_t, ctypes.c_uint32, ctypes.c_int]
+    setxattr.restype = ctypes.c_int
+    return getxattr, setxattr
+
+
+_getxattr, _setxattr = _load_xattr_functions()
+
+
+def _get_user_tags_xattr(path):
+    """
+    Read the Finder tags of a file or folder directly.
+
+    Args:
+        path (str or Path): File or folder to inspect
+
+    Returns:
+        list: Tags as "name\ncolor index" strings; empty if the path has no
+              tags yet
+
+    Raises:
+        OSError: If the attribute could not be read or makes no sense
+    """
+    path_bytes = os.fsencode(path)
+    size = _getxattr(path_bytes, _TAG_XATTR, None, 0, 0, 0)
+    if size >= 0:
+        buffer = ctypes.create_string_buffer(size)
+        size = _getxattr(path_bytes, _TAG_XATTR, buffer, size, 0, 0)
+    if size < 0:
+        err = ctypes.get_errno()
+        if err == _ENOATTR:
+            return []
+        raise OSError(err, os.strerror(err), os.fspath(path))
+
+    try:
+        tags = plistlib.loads(buffer.raw[:size])
+    except Exception as e:
+        raise OSError(f"Malformed tags on {path}: {e}") from e
+    if not isinstance(tags, list) or not all(isinstance(tag, str) for tag in tags):
+        raise OSError(f"Malformed tags on {path}")
+    return tags
+
+
+def _set_user_tags_xattr(path, tag_entries):
+    """
+    Write the full list of Finder tags of a file or folder directly.
+
+    Args:
+        path (str or Path): File or folder to tag
+        tag_entries (list): Tags as "name\ncolor index" strings
+
+    Raises:
+        OSError: If the attribute could not be written
+    """
+    value = plistlib.dumps(tag_entries, fmt=plistlib.FMT_BINARY)
+    if _setxattr(os.fsencode(path), _TAG_XATTR, value, len(value), 0, 0) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err), os.fspath(path))
+
+
+@functools.lru_cache(maxsize=1)
+def _find_tag_bin():
+    """
+    Look up the 'tag' command on the PATH once per process.
+
+    Returns:
+        str: Absolute path of the command, or None if it is not installed
+    """
+    return shutil.which("tag")
+
+
+class _TagShell:
+    """A long-lived shell that runs tag commands without starting a process from Python each time."""
+
+    # Printed with a command's exit status once the command has finished
+    _SENTINEL = "__DONE__"
+
+    def __init__(self):
+        """Start the shell."""
+        self._proc = subprocess.Popen(
+            ["/bin/sh"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+
+    def run(self, argv):
+        """
+        Run a command in the shell and wait for it to finish.
+
+        Args:
+            argv (list): Command and its arguments
+
+        Returns:
+            int: Exit status of the command
+
+        Raises:
+            OSError: If the shell has exited
+        """
+        command = " ".join(shlex.quote(os.fspath(arg)) for arg in argv)
+        self._proc.stdin.write(f"{command} >/dev/null 2>&1; echo {self._SENTINEL} $?\n")
+        self._proc.stdin.flush()
+
+        for line in self._proc.stdout:
+            if line.startswith(self._SENTINEL):
+                return int(line.split()[1])
+        raise OSError("tag shell exited unexpectedly")
+
+    def close(self):
+        """Let the shell exit once it has run everything sent to it."""
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        self._proc.wait()
+
+
 class TagManager:
     """Manages macOS file tags."""
 
     def __init__(self):
         """Initialize the tag manager."""
+        # Shell running the tag command, started on first use
+        self._shell = None
+        self._shell_lock = threading.Lock()
+
         # Check if tag command is available
         self._check_tag_command()
 
+        # Tags are applied in the background so callers never wait for them;
+        # the worker thread is started on first use
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def __enter__(self):
+        """Use the tag manager as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Apply all queued tags and stop the background worker and shell."""
+        self.close()
+
     def _check_tag_command(self):
         """Check if 'tag' command-line tool is available."""
-        try:
-            subprocess.run(["tag", "--version"], capture_output=True, check=True)
-            self.tag_command_available = True
-        except (subprocess.SubprocessError, FileNotFoundError):
+        # Resolved once, so running it doesn't search the PATH again
+        self._tag_bin = _find_tag_bin()
+        self.tag_command_available = self._tag_bin is not None
+
+        # Tags can still be written directly where the system allows it
+        if not self.tag_command_available and _setxattr is None:
             logger.warning("'tag' command not found. File tagging will be disabled.")
             logger.warning("Install with: brew install tag")
-            self.tag_command_available = False
+
+    def _run_tag(self, args):
+        """
+        Run the tag command in the persistent shell.
+
+        Args:
+            args (list): Arguments to pass to the tag command
+
+        Returns:
+            int: Exit status of the tag command
+        """
+        with self._shell_lock:
+            if self._shell is None:
+                self._shell = _TagShell()
+
+            try:
+                return self._shell.run([self._tag_bin, *args])
+            except OSError:
+                # Start a fresh shell next time
+                self._shell.close()
+                self._shell = None
+                raise
+
+    def _enqueue(self, paths, tag_name):
+        """Queue paths to be tagged, starting the worker thread if needed."""
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._drain, daemon=True)
+                self._worker.start()
+            self._queue.put((paths, tag_name))
+
+    def _drain(self):
+        """Apply queued tags, one batch per run of requests for the same tag."""
+        stopping = False
+        while not stopping:
+            # None asks the worker to stop once everything before it is applied
+            requests = []
+            request = self._queue.get()
+            while True:
+                if request is None:
+                    stopping = True
+                    self._queue.task_done()
+                    break
+                requests.append(request)
+                try:
+                    request = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            # Merge consecutive requests for the same tag, keeping their order
+            batches = []
+            for paths, tag_name in requests:
+                if batches and batches[-1][1] == tag_name:
+                    batches[-1][0].extend(paths)
+                else:
+                    batches.append((list(paths), tag_name))
+
+            for paths, tag_name in batches:
+                try:
+                    self._apply_now(paths, tag_name)
+                except Exception as e:
+                    logger.error(f"Unexpected error applying tag '{tag_name}': {e}", exc_info=True)
+
+            for _ in requests:
+                self._queue.task_done()
+
+    def flush(self):
+        """Wait until all queued tags have been applied."""
+        self._queue.join()
+
+    def close(self):
+        """Apply queued tags, then stop the worker thread and the tag shell."""
+        with self._worker_lock:
+            if self._worker is not None:
+                self._queue.put(None)
+                self._worker.join()
+                self._worker = None
+
+        with self._shell_lock:
+            if self._shell is not None:
+                self._shell.close()
+                self._shell = None
 
     def apply_tag(self, path, tag_name):
-        """Apply a tag to a file or folder using macOS tag system."""
-        if not self.tag_command_available:
-            logger.warning(f"Tag command not available, cannot tag {path}")
+        """Queue a tag to be applied to a file or folder using macOS tag system."""
+        self._enqueue([path], tag_name)
+
+    def apply_tags_batch(self, paths, tag_name):
+        """
+        Queue a tag to be applied to many files or folders.
+
+        Args:
+            paths (list): Files or folders to tag
+            tag_name (str): Tag to apply
+        """
+        self._enqueue(list(paths), tag_name)
+
+    def _apply_now(self, paths, tag_name):
+        """
+        Apply a tag to many files or folders with as few tag calls as possible.
+
+        Tags are written straight into each path's extended attributes, next
+        to the tags the path already has. Paths that can't be tagged that way
+        are handed to the tag command, which accepts any number of paths, so
+        they are passed in chunks instead of starting a process per path.
+
+        Args:
+            paths (list): Files or folders to tag
+            tag_name (str): Tag to apply
+        """
+        # Determine tag color based on tag name
+        spec = _TAG_SPEC.get(tag_name) or _make_tag_spec(tag_name, REVIEW_TAG_COLOR)
+        tag_color = spec.color
+
+        # Checked once, so per-path messages aren't formatted only to be dropped
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        log_info = logger.isEnabledFor(logging.INFO)
+
+        # Paths read with the tag in another color, which the tag command
+        # has to remove before adding it again
+        recolor = set()
+
+        if _setxattr is not None:
+            failed = []
+            for path in paths:
+                try:
+                    tags = _get_user_tags_xattr(path)
+
+                    # Leave paths that already carry the tag in this color alone
+                    if spec.entry in tags:
+                        continue
+
+                    # Keep the other tags, but drop the tag in any other color
+                    others = [tag for tag in tags if tag.split("\n", 1)[0] != tag_name]
+                    if len(others) < len(tags):
+                        recolor.add(os.fspath(path))
+                    _set_user_tags_xattr(path, others + [spec.entry])
+                except OSError as e:
+                    if log_debug:
+                        logger.debug(f"Could not write tags of {path} directly: {e}")
+                    failed.append(path)
+                    continue
+                if log_info:
+                    logger.info(f"Applied tag '{tag_name}' ({tag_color}) to {path}")
+            paths = failed
+
+        if not paths:
             return
 
-        path_str = str(path)
+        if not self.tag_command_available:
+            for path in paths:
+                logger.warning(f"Tag command not available, cannot tag {path}")
+            return
 
-        try:
-            # Determine tag color based on tag name
-            tag_color = MANUAL_TAG_COLOR if tag_name == "Manual" else REVIEW_TAG_COLOR
+        for start in range(0, len(paths), TAG_BATCH_SIZE):
+            chunk = paths[start:start + TAG_BATCH_SIZE]
 
-            # First remove any existing tag with this name to ensure we apply the correct color
+            # Adding keeps the paths' other tags, but leaves the color of a tag
+            # that is already there, so a tag in another color is removed first
+            path_strs = list(map(os.fspath, chunk))
+            stale = [path_str for path_str in path_strs if path_str in recolor]
             try:
-                subprocess.run(
-                    ["tag", "-r", tag_name, path_str],
-                    capture_output=True,
-                    check=False  # Don't fail if tag doesn't exist
-                )
-            except Exception:
-                pass
-
-            # Apply the tag with color
-            subprocess.run(
-                ["tag", "-a", f"{tag_name},{tag_color}", path_str],
-                check=True
-            )
-
-            logger.info(f"Applied tag '{tag_name}' ({tag_color}) to {path}")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error applying tag to {path}: {e}")
-        except Exception as e:
-            logger.error(f"Unexpected error applying tag to {path}: {e}")
+                if stale:
+                    self._run_tag(["-r", tag_name, *stale])  # -a reports any failure
+                status = self._run_tag(["-a", spec.arg, *path_strs])
+            except Exception as e:
+                logger.error(f"Unexpected error applying tag to {', '.join(path_strs)}: {e}")
+                continue
+            if status:
+                logger.error(f"Error applying tag to {', '.join(path_strs)}: exit status {status}")
+                continue
+
+            if log_info:
+                for path in chunk:
+                    logger.info(f"Applied tag '{tag_name}' ({tag_color}) to {path}")
 
     def remove_tag(self, path, tag_name):
         """Remove a tag from a file or folder."""
         if not self.tag_command_available:
             return
 
-        path_str = str(path)
+        # Let tags queued earlier land first
+        self.flush()
+
+        path_str = os.fspath(path)
 
         try:
-            subprocess.run(
-                ["tag", "-r", tag_name, path_str],
-                check=True
-            )
-            logger.info(f"Removed tag '{tag_name}' from {path}")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Error removing tag from {path}: {e}")
+            status = self._run_tag(["-r", tag_name, path_str])
         except Exception as e:
-            logger.error(f"Unexpected error removing tag from {path}: {e}")
\ No newline at end of file
+            logger.error(f"Unexpected error removing tag from {path}: {e}")
+            return
+
+        if status == 0:
+            logger.info(f"Removed tag '{tag_name}' from {path}")
+        else:
+            logger.error(f"Error removing tag from {path}: exit status {status}")
\ No newline at end of file
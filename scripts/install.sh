@@ -14,7 +14,7 @@ source .venv/bin/activate
 
 # Build and install the Python package
 echo "Installing Python package..."
-pip install -e .
+pip install -e ".[fast]"
 
 # Install 'tag' command line tool if not already installed
 if ! command -v tag &> /dev/null; then
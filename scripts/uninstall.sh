@@ -30,6 +30,12 @@ if [ -f "/usr/local/bin/mac-file-organizer-wrapper" ]; then
     echo "Wrapper script removed"
 fi
 
+# Remove the scan cache
+if [ -f "$HOME/Library/Caches/mac-file-organizer.db" ]; then
+    rm -f "$HOME/Library/Caches/mac-file-organizer.db"
+    echo "Scan cache removed"
+fi
+
 echo ""
 echo "Mac File Organizer has been uninstalled."
 echo "Note: The organized folders and files in your Downloads and Desktop remain untouched."
@@ -0,0 +1,40 @@
+"""
+Tests for name similarity and smart grouping.
+"""
+import unittest
+
+from mac_file_organizer.file_grouper import FileGrouper
+from mac_file_organizer.file_manager import _identify_potential_groups
+
+
+class SimilarityCandidatesTest(unittest.TestCase):
+    """The candidate prefilter must keep every pair the full score accepts."""
+
+    # Same words, but too few characters in common for the character ratio
+    NAME1 = "x1 y2 z3 w4 v5 report budget"
+    NAME2 = "q7 report budget k1 m2 n3 p4"
+
+    def setUp(self):
+        self.grouper = FileGrouper()
+
+    def test_token_match_is_similar(self):
+        similarity = self.grouper._calculate_name_similarity(self.NAME1, self.NAME2)
+        self.assertGreaterEqual(similarity, self.grouper.similarity_threshold)
+
+    def test_token_match_is_a_candidate(self):
+        sig1 = self.grouper._name_sig(self.NAME1)
+        sig2 = self.grouper._name_sig(self.NAME2)
+        self.assertEqual(self.grouper._similarity_candidates(sig1, [sig2]), [0])
+
+    def test_token_match_is_grouped(self):
+        files = [f"/tmp/{self.NAME1}.pdf", f"/tmp/{self.NAME2}.pdf"]
+        groups = _identify_potential_groups(self.grouper, files)
+
+        self.assertEqual(len(groups), 1)
+        group_name, group_files = next(iter(groups.items()))
+        self.assertIn(group_name, {"Report", "Budget"})
+        self.assertEqual(sorted(group_files), sorted(files))
+
+
+if __name__ == "__main__":
+    unittest.main()
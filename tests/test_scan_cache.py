@@ -0,0 +1,61 @@
+"""
+Tests for the cache of already grouped directories.
+"""
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from mac_file_organizer.scan_cache import ScanCache
+
+
+class ScanCacheTest(unittest.TestCase):
+    """A directory is skipped only while its (dev, ino, mtime) is unchanged."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.cache_path = self.root / "cache.db"
+        self.directory = self.root / "Downloads"
+        self.directory.mkdir()
+        self.cache = ScanCache(path=self.cache_path)
+
+    def tearDown(self):
+        self.cache._conn.close()
+        self._tmp.cleanup()
+
+    def _set_mtime(self, seconds):
+        os.utime(self.directory, (seconds, seconds))
+
+    def test_unknown_directory_is_scanned(self):
+        state = self.cache.get_state(self.directory)
+        self.assertFalse(self.cache.is_unchanged(state))
+
+    def test_unchanged_directory_is_skipped(self):
+        self._set_mtime(1_000_000)
+        self.cache.mark_grouped(self.cache.get_state(self.directory))
+
+        self.assertTrue(self.cache.is_unchanged(self.cache.get_state(self.directory)))
+
+    def test_changed_mtime_is_rescanned(self):
+        self._set_mtime(1_000_000)
+        self.cache.mark_grouped(self.cache.get_state(self.directory))
+
+        self._set_mtime(2_000_000)
+        self.assertFalse(self.cache.is_unchanged(self.cache.get_state(self.directory)))
+
+    def test_grouped_state_survives_reopening(self):
+        self._set_mtime(1_000_000)
+        state = self.cache.get_state(self.directory)
+        self.cache.mark_grouped(state)
+        self.cache.commit()
+
+        reopened = ScanCache(path=self.cache_path)
+        try:
+            self.assertTrue(reopened.is_unchanged(state))
+        finally:
+            reopened._conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()